@@ -0,0 +1,51 @@
+"""
+Layout and frame throughput of GraphView on a random 10k-node tree.
+
+    python benchmarks/graphview_layout.py [nodes]
+
+Frames are measured by serializing the node/edge shapes the same way
+`page.update()` does, so no running Flet app is needed.
+"""
+import random
+import sys
+import time
+
+from xilowidgets.graphview import GraphView
+
+
+def main(node_count: int = 10_000):
+    rnd = random.Random(0)
+    edges = [(i, rnd.randrange(i)) for i in range(1, node_count)]
+
+    started = time.perf_counter()
+    view = GraphView(nodes=node_count, edges=edges, seed=0, max_iterations=300)
+    print(f"build: {time.perf_counter() - started:.3f}s")
+
+    for i, shape in enumerate(view.shapes):
+        shape._Control__uid = f"_{i}"
+        shape._build_command(update=False)
+
+    layout = view.layout
+    started = time.perf_counter()
+    while layout.iterations < view.max_iterations:
+        if layout.step() < view.tolerance * layout.k:
+            break
+    elapsed = time.perf_counter() - started
+    print(
+        f"layout: {layout.iterations} iterations in {elapsed:.2f}s "
+        f"({elapsed / layout.iterations * 1000:.1f} ms/iteration)"
+    )
+
+    frames = 10
+    started = time.perf_counter()
+    for _ in range(frames):
+        layout.step()
+        view._GraphView__apply_positions()
+        for shape in view.shapes:
+            shape._build_command(update=True)
+    elapsed = time.perf_counter() - started
+    print(f"frames: {frames / elapsed:.1f} frames/s including one layout step each")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,122 @@
+"""
+Cost of the first serialization and of later updates of Revealer, XDialog and
+XDropdown sharing style objects, with and without the cached JSON attributes.
+
+    python benchmarks/json_attrs.py [controls] [rounds]
+
+The first serialization encodes every shared value once through `json_cache`.
+Each later round toggles `content_hidden` (or `open`) on every control and builds
+its update command the same way `page.update()` does.
+"""
+import sys
+import time
+from typing import Tuple
+
+import flet as ft
+
+from xilowidgets import Revealer, XDialog, XDropdown
+from xilowidgets.attrcache import CachedJsonAttrs, json_cache
+
+
+def revealer(theme: ft.Theme, border: ft.Border) -> Revealer:
+    return Revealer(
+        content=ft.Text("panel"),
+        content_hidden=True,
+        padding=ft.padding.all(8),
+        margin=ft.margin.symmetric(4, 8),
+        alignment=ft.alignment.center,
+        border=border,
+        border_radius=ft.border_radius.all(6),
+        theme=theme,
+        dark_theme=theme,
+        color_filter=ft.ColorFilter(color=ft.Colors.BLUE, blend_mode=ft.BlendMode.MULTIPLY),
+        foreground_decoration=ft.BoxDecoration(border=border),
+    )
+
+
+def dialog(style: ft.TextStyle) -> XDialog:
+    return XDialog(
+        title=ft.Text("title"),
+        content=ft.Text("content"),
+        content_padding=ft.padding.all(24),
+        title_padding=ft.padding.all(16),
+        actions_padding=ft.padding.all(8),
+        inset_padding=ft.padding.symmetric(40, 24),
+        icon_padding=ft.padding.all(4),
+        action_button_padding=ft.padding.all(4),
+        shape=ft.RoundedRectangleBorder(radius=12),
+        alignment=ft.alignment.center,
+        title_text_style=style,
+        content_text_style=style,
+    )
+
+
+def dropdown() -> XDropdown:
+    return XDropdown(
+        options=[ft.dropdown.Option(str(i)) for i in range(5)],
+        bgcolor={ft.ControlState.HOVERED: ft.Colors.BLUE, ft.ControlState.DEFAULT: ft.Colors.WHITE},
+        elevation={ft.ControlState.HOVERED: 8, ft.ControlState.DEFAULT: 2},
+    )
+
+
+def build(count: int):
+    theme = ft.Theme(color_scheme_seed=ft.Colors.GREEN, font_family="Roboto")
+    border = ft.border.all(1, ft.Colors.BLACK)
+    style = ft.TextStyle(size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.BLACK)
+    controls = []
+    for i in range(count):
+        controls += [revealer(theme, border), dialog(style), dropdown()]
+    for i, c in enumerate(controls):
+        c._Control__uid = f"_{i}"
+    return controls
+
+
+def serialize(controls) -> float:
+    started = time.perf_counter()
+    for c in controls:
+        c._build_command(update=False)
+    return time.perf_counter() - started
+
+
+def toggle(controls, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for c in controls:
+            if isinstance(c, Revealer):
+                c.content_hidden = not c.content_hidden
+            elif isinstance(c, XDialog):
+                c.open = not c.open
+            else:
+                c.disabled = not c.disabled
+            c._build_command(update=True)
+    return time.perf_counter() - started
+
+
+def measure(count: int, rounds: int) -> Tuple[float, float]:
+    controls = build(count)
+    return serialize(controls), toggle(controls, rounds)
+
+
+def main(count: int = 300, rounds: int = 20):
+    json_cache.clear()
+    cached_build, cached = measure(count, rounds)
+
+    # the same controls with the plain Control._set_attr_json
+    original = CachedJsonAttrs._set_attr_json
+    CachedJsonAttrs._set_attr_json = lambda self, *args, **kwargs: super(
+        CachedJsonAttrs, self
+    )._set_attr_json(*args, **kwargs)
+    try:
+        plain_build, plain = measure(count, rounds)
+    finally:
+        CachedJsonAttrs._set_attr_json = original
+
+    print(f"first serialization: {plain_build:.3f}s plain, {cached_build:.3f}s cached")
+    print(f"json_cache: {json_cache.stats()}")
+    updates = count * 3 * rounds
+    print(f"plain:  {plain / updates * 1e6:.1f} us/update")
+    print(f"cached: {cached / updates * 1e6:.1f} us/update ({plain / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,116 @@
+"""
+Server-side cost of opening a complex XDialog the usual way and after
+`prepare()`.
+
+    python benchmarks/xdialog_open.py [fields] [rounds]
+
+"cold" adds a new dialog to the overlay and opens it, which is what
+`page.open(XDialog(...))` sends: the whole subtree. "prepared" opens a dialog
+that `prepare()` already mounted, which only sends the `open` flag. The time
+to build the commands, the size of the encoded message and the time to decode
+it again (what the client does before it can start the animation) are
+reported. The client also skips adding the controls to its store, and it
+builds the dialog widgets in both cases; neither is measured here.
+"""
+import json
+import sys
+import time
+from typing import List, Tuple
+
+import flet as ft
+from flet.core.page import Offstage
+from flet.core.protocol import CommandEncoder
+
+from xilowidgets import XDialog
+
+
+def form_dialog(fields: int) -> XDialog:
+    return XDialog(
+        title=ft.Text("Edit record"),
+        content=ft.Column(
+            [ft.TextField(label=f"Field {i}", value=str(i)) for i in range(fields)],
+            scroll=ft.ScrollMode.AUTO,
+        ),
+        actions=[ft.TextButton("Save"), ft.TextButton("Cancel")],
+        shape=ft.RoundedRectangleBorder(radius=12),
+        content_padding=ft.padding.all(24),
+        launch_direction=XDialog.LaunchDirection.BOTTOM,
+        animation_curve=ft.AnimationCurve.EASE_OUT,
+    )
+
+
+class _Uids:
+    def __init__(self):
+        self.next = 0
+
+    def assign(self, added: List[ft.Control]):
+        for c in added:
+            if not c.uid:
+                c._Control__uid = f"_{self.next}"
+                self.next += 1
+
+
+def open_update(overlay: Offstage, dialog: XDialog, uids: _Uids) -> Tuple[float, int, float]:
+    """Opens `dialog` like `page.open()`; returns the build time, message size and decode time."""
+    started = time.perf_counter()
+    commands, added, removed = [], [], []
+    dialog.open = True
+    if dialog not in overlay.controls:
+        overlay.controls.append(dialog)
+        overlay.build_update_commands({}, commands, added, removed)
+    else:
+        dialog.build_update_commands({}, commands, added, removed)
+    message = json.dumps(commands, cls=CommandEncoder)
+    elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    json.loads(message)
+    decode = time.perf_counter() - started
+    uids.assign(added)
+    return elapsed, len(message), decode
+
+
+def measure(fields: int, rounds: int):
+    uids = _Uids()
+    overlay = Offstage()
+    overlay._Control__uid = "overlay"
+    overlay._build_add_commands(index={"page": None})
+
+    cold_time = cold_size = cold_decode = 0.0
+    for _ in range(rounds):
+        t, size, decode = open_update(overlay, form_dialog(fields), uids)
+        cold_time += t
+        cold_size += size
+        cold_decode += decode
+        overlay.controls.clear()
+        overlay.build_update_commands({}, [], [], [])
+
+    warm_time = warm_size = warm_decode = 0.0
+    for _ in range(rounds):
+        dialog = form_dialog(fields)
+        # what prepare() sends ahead of time
+        dialog.prepared = True
+        overlay.controls.append(dialog)
+        added = []
+        overlay.build_update_commands({}, [], added, [])
+        uids.assign(added)
+        t, size, decode = open_update(overlay, dialog, uids)
+        warm_time += t
+        warm_size += size
+        warm_decode += decode
+        overlay.controls.clear()
+        overlay.build_update_commands({}, [], [], [])
+
+    return (
+        (cold_time / rounds, cold_size / rounds, cold_decode / rounds),
+        (warm_time / rounds, warm_size / rounds, warm_decode / rounds),
+    )
+
+
+def main(fields: int = 50, rounds: int = 50):
+    cold, warm = measure(fields, rounds)
+    for label, (t, size, decode) in (("cold open:    ", cold), ("prepared open:", warm)):
+        print(f"{label} build {t * 1e3:.2f} ms, {size / 1024:.2f} KiB, decode {decode * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
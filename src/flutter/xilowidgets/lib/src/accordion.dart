@@ -0,0 +1,116 @@
+import 'dart:convert';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+class AccordionControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+  final List<Control> children;
+  final bool parentDisabled;
+  final bool? parentAdaptive;
+  final FletControlBackend backend;
+
+  const AccordionControl({
+    super.key,
+    required this.parent,
+    required this.control,
+    required this.children,
+    required this.parentDisabled,
+    required this.parentAdaptive,
+    required this.backend,
+  });
+
+  @override
+  State<AccordionControl> createState() => _AccordionControlState();
+}
+
+class _AccordionControlState extends State<AccordionControl> {
+  final ScrollController _scrollController = ScrollController();
+  double? _lastOffset;
+  double? _lastViewport;
+
+  @override
+  void initState() {
+    super.initState();
+    _scrollController.addListener(_onScroll);
+  }
+
+  @override
+  void dispose() {
+    _scrollController.removeListener(_onScroll);
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  void _onScroll() {
+    var position = _scrollController.position;
+    _report(position.pixels, position.viewportDimension);
+  }
+
+  // only sends when the offset moved by a whole step, so the server does at
+  // most one layout per step
+  void _report(double offset, double viewport) {
+    var step = widget.control.attrDouble("scrollStep", 48)!;
+    if (_lastOffset != null &&
+        (offset - _lastOffset!).abs() < step &&
+        viewport == _lastViewport) {
+      return;
+    }
+    _lastOffset = offset;
+    _lastViewport = viewport;
+    widget.backend.triggerControlEvent(widget.control.id, "scroll",
+        json.encode({"offset": offset, "viewport": viewport}));
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("Accordion build: ${widget.control.id}");
+
+    bool disabled = widget.control.isDisabled || widget.parentDisabled;
+    double extent = widget.control.attrDouble("extent", 0)!;
+    var duration = Duration(
+        milliseconds: widget.control.attrInt("animationDuration", 300)!);
+    var curve = parseCurve(widget.control.attrString("curve"), Curves.easeOutBack)!;
+
+    // rows are positioned absolutely and keyed by their index, so a recycled
+    // row starts fresh instead of animating from its previous place
+    List<Widget> rows = widget.children
+        .where((row) => row.isVisible && row.childIds.isNotEmpty)
+        .map((row) => AnimatedPositioned(
+              key: ValueKey(row.attrString("index")),
+              duration: duration,
+              curve: curve,
+              top: row.attrDouble("top", 0)!,
+              left: 0,
+              right: 0,
+              child: createControl(row, row.childIds.first, disabled,
+                  parentAdaptive: widget.parentAdaptive),
+            ))
+        .toList();
+
+    var list = LayoutBuilder(builder: (context, constraints) {
+      if (constraints.maxHeight.isFinite &&
+          constraints.maxHeight != _lastViewport) {
+        WidgetsBinding.instance.addPostFrameCallback((_) {
+          if (mounted) {
+            _report(
+                _scrollController.hasClients
+                    ? _scrollController.position.pixels
+                    : 0,
+                constraints.maxHeight);
+          }
+        });
+      }
+      return SingleChildScrollView(
+        controller: _scrollController,
+        child: SizedBox(
+          height: extent,
+          child: Stack(children: rows),
+        ),
+      );
+    });
+
+    return constrainedControl(context, list, widget.parent, widget.control);
+  }
+}
@@ -5,11 +5,14 @@ import 'package:xilowidgets/src/xdialog.dart';
 import 'package:xilowidgets/src/media_query.dart';
 import 'package:xilowidgets/src/xdropdown.dart';
 
+import 'accordion.dart';
 import 'drawboard.dart';
+import 'responsive.dart';
 import 'revealer.dart';
 import 'zoomer.dart';
 import 'editor.dart';
 import 'switcher.dart';
+import 'tiled_image.dart';
 
 final Mode pseudocode = Mode(
   className: 'pseudocode',
@@ -85,6 +88,7 @@ CreateControlFactory createControl = (CreateControlArgs args) {
         children: args.children,
         parentAdaptive: args.parentAdaptive,
         parentDisabled: args.parentDisabled,
+        backend: args.backend,
       );
     case "editor":
       return EditorControl(
@@ -142,6 +146,29 @@ CreateControlFactory createControl = (CreateControlArgs args) {
         parentAdaptive: args.parentAdaptive, 
         backend: args.backend
       );
+    case "tiledimage":
+      return TiledImageControl(
+        parent: args.parent,
+        control: args.control,
+        backend: args.backend
+      );
+    case "accordion":
+      return AccordionControl(
+        parent: args.parent,
+        control: args.control,
+        children: args.children,
+        parentDisabled: args.parentDisabled,
+        parentAdaptive: args.parentAdaptive,
+        backend: args.backend
+      );
+    case "responsive":
+      return ResponsiveControl(
+        parent: args.parent,
+        control: args.control,
+        children: args.children,
+        parentDisabled: args.parentDisabled,
+        parentAdaptive: args.parentAdaptive
+      );
     default:
       return null;
   }
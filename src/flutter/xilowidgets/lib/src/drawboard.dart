@@ -1,3 +1,4 @@
+import 'dart:async';
 import 'dart:convert';
 import 'dart:typed_data';
 import 'dart:ui' as ui;
@@ -50,6 +51,46 @@ class DrawboardViewModel extends Equatable {
 
 typedef DrawboardControlOnPaintCallback = void Function(Size size);
 
+class DrawboardStroke {
+  final int id;
+  final Duration start;
+  final List<double> xs = [];
+  final List<double> ys = [];
+  final List<double> pressures = [];
+  final List<double> times = [];
+  // samples already sent in `stroke` packets
+  int flushed = 0;
+
+  DrawboardStroke(this.id, this.start);
+
+  int get length => xs.length;
+
+  void add(PointerEvent e) {
+    xs.add(e.localPosition.dx);
+    ys.add(e.localPosition.dy);
+    pressures.add(e.pressure);
+    times.add((e.timeStamp - start).inMicroseconds / 1000.0);
+  }
+
+  List<Offset> get points =>
+      List.generate(length, (i) => Offset(xs[i], ys[i]), growable: false);
+
+  // samples [from, length) packed column by column as little-endian float32:
+  // x..., y..., pressure..., time...
+  String pack(int from) {
+    var n = length - from;
+    var data = Float32List(n * 4);
+    for (var i = 0; i < n; i++) {
+      data[i] = xs[from + i];
+      data[n + i] = ys[from + i];
+      data[2 * n + i] = pressures[from + i];
+      data[3 * n + i] = times[from + i];
+    }
+    return json.encode(
+        {"id": id, "n": n, "d": base64Encode(data.buffer.asUint8List())});
+  }
+}
+
 class DrawboardControl extends StatefulWidget {
   final Control? parent;
   final Control control;
@@ -75,6 +116,130 @@ class _DrawboardControlState extends State<DrawboardControl> {
   int _lastResize = DateTime.now().millisecondsSinceEpoch;
   Size? _lastSize;
   FletCustomPainter? painter;
+  final ValueNotifier<int> _strokeRepaint = ValueNotifier<int>(0);
+  final List<DrawboardStroke> _strokes = [];
+  // strokes being drawn, by pointer, so simultaneous touches stay apart
+  final Map<int, DrawboardStroke> _activeStrokes = {};
+  // ids stay unique across remounts, committed shapes keep the id of their stroke
+  int _strokeId = DateTime.now().microsecondsSinceEpoch;
+  Timer? _strokeTimer;
+  final Map<String, ControlTreeViewModel> _sceneShapes = {};
+  int _sceneVersion = 0;
+
+  @override
+  void dispose() {
+    _strokeTimer?.cancel();
+    _strokeRepaint.dispose();
+    super.dispose();
+  }
+
+  void _onPointerDown(PointerDownEvent e, bool streamStroke, int interval) {
+    var stroke = DrawboardStroke(++_strokeId, e.timeStamp)..add(e);
+    _activeStrokes[e.pointer] = stroke;
+    _strokes.add(stroke);
+    if (streamStroke && _strokeTimer == null) {
+      _strokeTimer = Timer.periodic(
+          Duration(milliseconds: interval), (_) => _flushStrokes());
+    }
+    _strokeRepaint.value++;
+  }
+
+  void _onPointerMove(PointerMoveEvent e) {
+    _activeStrokes[e.pointer]?.add(e);
+    _strokeRepaint.value++;
+  }
+
+  void _onPointerUp(PointerEvent e) {
+    var stroke = _activeStrokes.remove(e.pointer);
+    if (stroke == null) {
+      return;
+    }
+    if (_strokeTimer != null) {
+      _flushStroke(stroke);
+      if (_activeStrokes.isEmpty) {
+        _strokeTimer!.cancel();
+        _strokeTimer = null;
+      }
+    }
+    widget.backend
+        .triggerControlEvent(widget.control.id, "stroke_end", stroke.pack(0));
+    if (!widget.control.attrBool("commitStrokes", true)!) {
+      // no shape will replace it, so it would be kept forever
+      _strokes.remove(stroke);
+      _strokeRepaint.value++;
+    }
+  }
+
+  ControlTreeViewModel _sceneShape(
+      String id, String type, Map<String, String> attrs) {
+    return ControlTreeViewModel(
+        control: Control(
+            id: id,
+            pid: widget.control.id,
+            type: type,
+            name: null,
+            childIds: const [],
+            attrs: attrs,
+            isNonVisual: false),
+        children: const []);
+  }
+
+  void _applyScenePatch(String patch) {
+    var j = json.decode(patch);
+    int version = j["v"];
+    bool reset = j["reset"] == true;
+    if (!reset && version <= _sceneVersion) {
+      // already contained in the snapshot received before
+      return;
+    }
+    setState(() {
+      if (reset) {
+        _sceneShapes.clear();
+      }
+      _sceneVersion = version;
+      for (var op in j["ops"] as List) {
+        var id = "${widget.control.id}_scene_${op.length > 1 ? op[1] : ""}";
+        switch (op[0]) {
+          case "a":
+            _sceneShapes[id] =
+                _sceneShape(id, op[2], Map<String, String>.from(op[3]));
+          case "u":
+            var current = _sceneShapes[id];
+            if (current != null) {
+              var attrs = Map<String, String>.from(current.control.attrs);
+              (op[2] as Map).forEach((k, v) {
+                // null marks a removed attribute
+                if (v == null) {
+                  attrs.remove(k);
+                } else {
+                  attrs[k] = v;
+                }
+              });
+              _sceneShapes[id] = _sceneShape(id, current.control.type, attrs);
+            }
+          case "r":
+            _sceneShapes.remove(id);
+          case "c":
+            _sceneShapes.clear();
+        }
+      }
+    });
+  }
+
+  void _flushStrokes() {
+    for (var stroke in _activeStrokes.values) {
+      _flushStroke(stroke);
+    }
+  }
+
+  void _flushStroke(DrawboardStroke stroke) {
+    if (stroke.length <= stroke.flushed) {
+      return;
+    }
+    widget.backend.triggerControlEvent(
+        widget.control.id, "stroke", stroke.pack(stroke.flushed));
+    stroke.flushed = stroke.length;
+  }
 
   Future<String> _captureCanvas(double width, double height) async {
     try {
@@ -106,6 +271,8 @@ class _DrawboardControlState extends State<DrawboardControl> {
               double.parse(args["width"].toString()), 
               double.parse(args["height"].toString())
             );
+          case "scene":
+            _applyScenePatch(args["patch"].toString());
         }
         return null;
       });
@@ -121,11 +288,34 @@ class _DrawboardControlState extends State<DrawboardControl> {
         builder: (context, viewModel) {
           var onResize = viewModel.control.attrBool("onResize", false)!;
           var resizeInterval = viewModel.control.attrInt("resizeInterval", 10)!;
+          var strokeCapture = viewModel.control.attrBool("strokeCapture", false)!;
+          var onStroke = viewModel.control.attrBool("onStroke", false)!;
+          var strokeInterval = viewModel.control.attrInt("strokeInterval", 50)!;
+          var theme = Theme.of(context);
+          var strokePaint = viewModel.control.attrString("strokePaint") != null
+              ? parsePaint(theme, viewModel.control, "strokePaint")
+              : (Paint()
+                ..strokeWidth = 2
+                ..style = ui.PaintingStyle.stroke);
+
+          // finished strokes are drawn locally until the server commits them
+          if (_strokes.isNotEmpty) {
+            var committed = viewModel.shapes
+                .map((s) => s.control.attrInt("strokeId"))
+                .nonNulls
+                .toSet();
+            _strokes.removeWhere((s) => committed.contains(s.id));
+          }
 
           painter = FletCustomPainter(
             context: context,
-            theme: Theme.of(context),
-            shapes: viewModel.shapes,
+            theme: theme,
+            shapes: _sceneShapes.isEmpty
+                ? viewModel.shapes
+                : [..._sceneShapes.values, ...viewModel.shapes],
+            strokes: _strokes,
+            strokePaint: strokePaint,
+            repaint: _strokeRepaint,
             onPaintCallback: (size) {
               if (onResize) {
                 var now = DateTime.now().millisecondsSinceEpoch;
@@ -143,7 +333,7 @@ class _DrawboardControlState extends State<DrawboardControl> {
             },
           );
 
-          var paint = CustomPaint(
+          Widget paint = CustomPaint(
             painter: painter,
             child: viewModel.child != null
                 ? createControl(viewModel.control, viewModel.child!.id,
@@ -152,6 +342,18 @@ class _DrawboardControlState extends State<DrawboardControl> {
                 : null,
           );
 
+          if (strokeCapture) {
+            paint = Listener(
+              behavior: HitTestBehavior.opaque,
+              onPointerDown: (e) =>
+                  _onPointerDown(e, onStroke, strokeInterval),
+              onPointerMove: _onPointerMove,
+              onPointerUp: _onPointerUp,
+              onPointerCancel: _onPointerUp,
+              child: paint,
+            );
+          }
+
           return paint;
         });
 
@@ -163,13 +365,18 @@ class FletCustomPainter extends CustomPainter {
   final BuildContext context;
   final ThemeData theme;
   final List<ControlTreeViewModel> shapes;
+  final List<DrawboardStroke> strokes;
+  final Paint? strokePaint;
   final DrawboardControlOnPaintCallback onPaintCallback;
 
   const FletCustomPainter(
       {required this.context,
       required this.theme,
       required this.shapes,
-      required this.onPaintCallback});
+      required this.onPaintCallback,
+      this.strokes = const [],
+      this.strokePaint,
+      super.repaint});
 
   @override
   void paint(Canvas canvas, Size size) {
@@ -202,6 +409,13 @@ class FletCustomPainter extends CustomPainter {
         drawText(context, canvas, shape);
       }
     }
+
+    for (var stroke in strokes) {
+      canvas.drawPoints(
+          stroke.length > 1 ? ui.PointMode.polygon : ui.PointMode.points,
+          stroke.points,
+          strokePaint ?? Paint());
+    }
   }
 
   @override
@@ -1,18 +1,23 @@
 import 'package:flet/flet.dart';
 import 'package:flutter/material.dart';
+import 'dart:async';
 import 'dart:convert';
+import 'dart:math';
 
 class MediaQuerySizeChangeEvent {
   final double width;
   final double height;
+  final int suppressed;
 
   MediaQuerySizeChangeEvent(
       {required this.width,
-      required this.height});
+      required this.height,
+      this.suppressed = 0});
 
   Map<String, dynamic> toJson() => <String, dynamic>{
         'width': width,
         'height': height,
+        'suppressed': suppressed,
       };
 }
 
@@ -27,6 +32,21 @@ class MediaQueryThemeModeChangeEvent {
       };
 }
 
+class MediaQueryBreakpointChangeEvent {
+  final String name;
+  final int index;
+  final double width;
+
+  MediaQueryBreakpointChangeEvent(
+      {required this.name, required this.index, required this.width});
+
+  Map<String, dynamic> toJson() => <String, dynamic>{
+        'name': name,
+        'index': index,
+        'width': width,
+      };
+}
+
 class MediaQueryControl extends StatefulWidget with FletStoreMixin {
   final Control? parent;
   final Control control;
@@ -43,14 +63,134 @@ class MediaQueryControl extends StatefulWidget with FletStoreMixin {
 }
 
 class _MediaQueryControlState extends State<MediaQueryControl> with FletStoreMixin {
+  // last values reported to Flet, so only real changes are sent
+  Size? _lastSize;
+  bool? _lastThemeMode;
+  String? _lastBreakpoint;
+  final Map<String, dynamic> _lastMetrics = {};
+  String? _breakpointsJson;
+  // (name, min_width, position in the list given on the Python side)
+  List<(String, double, int)> _breakpoints = [];
+
+  // size_change rate limiting, see MediaQueryRatePolicy on the Python side
+  Timer? _sizeTimer;
+  Size? _pendingSize;
+  int _lastSizeSentAt = 0;
+  int _suppressedSizes = 0;
 
-  Future<void> returnSizeToFlet(double _width, double _height) async {
+  @override
+  void dispose() {
+    _sizeTimer?.cancel();
+    super.dispose();
+  }
+
+  void _submitSize(Size size) {
+    var policyJson = widget.control.attrString("sizeChangePolicy");
+    if (policyJson == null) {
+      _sendSize(size);
+      return;
+    }
+    var policy = json.decode(policyJson);
+    var debounce = parseDouble(policy["debounce"], 0)!.toInt();
+    var throttle = parseDouble(policy["throttle"], 0)!.toInt();
+    var leading = parseBool(policy["leading"], false)!;
+    var now = DateTime.now().millisecondsSinceEpoch;
+
+    if (_pendingSize != null) {
+      _suppressedSizes++;
+    }
+    if (leading && _sizeTimer == null && now - _lastSizeSentAt >= throttle) {
+      _pendingSize = null;
+      _sendSize(size);
+    } else {
+      _pendingSize = size;
+    }
+    if (_sizeTimer == null || debounce > 0) {
+      // throttling keeps the running timer, debouncing restarts it
+      _sizeTimer?.cancel();
+      var wait = max(max(debounce, throttle - (now - _lastSizeSentAt)), 0);
+      _sizeTimer = Timer(Duration(milliseconds: wait), () {
+        _sizeTimer = null;
+        var pending = _pendingSize;
+        _pendingSize = null;
+        if (pending != null) {
+          _sendSize(pending);
+        }
+      });
+    }
+  }
+
+  void _sendSize(Size size) {
+    _lastSizeSentAt = DateTime.now().millisecondsSinceEpoch;
+    var suppressed = _suppressedSizes;
+    _suppressedSizes = 0;
     widget.backend.triggerControlEvent(
-      widget.control.id, 
-      "size_change", 
-      json.encode(MediaQuerySizeChangeEvent(
-          width: _width,
-          height: _height)
+        widget.control.id,
+        "size_change",
+        json.encode(MediaQuerySizeChangeEvent(
+                width: size.width,
+                height: size.height,
+                suppressed: suppressed)
+            .toJson()));
+  }
+
+  List<(String, double, int)> _parseBreakpoints() {
+    var v = widget.control.attrString("breakpoints");
+    if (v != _breakpointsJson) {
+      _breakpointsJson = v;
+      _lastBreakpoint = null;
+      _breakpoints = v == null
+          ? []
+          : (json.decode(v) as List)
+              .indexed
+              .map((e) => (
+                    e.$2["name"].toString(),
+                    parseDouble(e.$2["min_width"], 0)!,
+                    e.$1
+                  ))
+              .toList();
+      _breakpoints.sort((a, b) => a.$2.compareTo(b.$2));
+    }
+    return _breakpoints;
+  }
+
+  List<double> _insets(EdgeInsets insets) =>
+      [insets.left, insets.top, insets.right, insets.bottom];
+
+  // sends only the metrics that changed since the last metrics_change
+  void _submitMetrics(MediaQueryData mediaQuery) {
+    var metrics = <String, dynamic>{
+      'device_pixel_ratio': mediaQuery.devicePixelRatio,
+      'text_scale_factor': mediaQuery.textScaler.scale(1),
+      'padding': _insets(mediaQuery.padding),
+      'view_insets': _insets(mediaQuery.viewInsets),
+    };
+    var delta = <String, dynamic>{};
+    metrics.forEach((key, value) {
+      var last = _lastMetrics[key];
+      var same = value is List<double>
+          ? last is List<double> && listEquals(last, value)
+          : last == value;
+      if (!same) {
+        delta[key] = value;
+      }
+    });
+    if (delta.isEmpty) {
+      return;
+    }
+    _lastMetrics.addAll(delta);
+    widget.backend.triggerControlEvent(
+        widget.control.id, "metrics_change", json.encode(delta));
+  }
+
+  Future<void> returnBreakpointToFlet(String name, int index, double width) async {
+    widget.backend.triggerControlEvent(
+      widget.control.id,
+      "breakpoint_change",
+      json.encode(MediaQueryBreakpointChangeEvent(
+          name: name,
+          index: index,
+          width: width)
       .toJson()));
   }
 
@@ -73,13 +213,39 @@ class _MediaQueryControlState extends State<MediaQueryControl> with FletStoreMix
     double screenHeight = mediaQuery.size.height;
     bool mode = mediaQuery.platformBrightness == Brightness.dark;
     
-    () async {
-      returnSizeToFlet(screenWidth, screenHeight);
-    }();
+    if (widget.control.attrBool("onSizeChange", false)! &&
+        mediaQuery.size != _lastSize) {
+      _lastSize = mediaQuery.size;
+      _submitSize(mediaQuery.size);
+    }
+
+    if (widget.control.attrBool("onThemeModeChange", false)! &&
+        mode != _lastThemeMode) {
+      _lastThemeMode = mode;
+      () async {
+        returnThemeModeToFlet(mode);
+      }();
+    }
+
+    if (widget.control.attrBool("onMetricsChange", false)!) {
+      _submitMetrics(mediaQuery);
+    }
 
-    () async {
-      returnThemeModeToFlet(mode);
-    }();
+    var breakpoints = _parseBreakpoints();
+    if (widget.control.attrBool("onBreakpointChange", false)! &&
+        breakpoints.isNotEmpty) {
+      var index = breakpoints.lastIndexWhere((b) => b.$2 <= screenWidth);
+      if (index < 0) {
+        index = 0;
+      }
+      var (name, _, position) = breakpoints[index];
+      if (name != _lastBreakpoint) {
+        _lastBreakpoint = name;
+        () async {
+          returnBreakpointToFlet(name, position, screenWidth);
+        }();
+      }
+    }
 
     Widget wg = SizedBox.shrink();
 
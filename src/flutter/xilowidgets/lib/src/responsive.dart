@@ -0,0 +1,37 @@
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+class ResponsiveControl extends StatelessWidget {
+  final Control? parent;
+  final Control control;
+  final List<Control> children;
+  final bool parentDisabled;
+  final bool? parentAdaptive;
+
+  const ResponsiveControl({
+    super.key,
+    required this.parent,
+    required this.control,
+    required this.children,
+    required this.parentDisabled,
+    required this.parentAdaptive,
+  });
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("Responsive build: ${control.id}");
+
+    bool disabled = control.isDisabled || parentDisabled;
+    int active = control.attrInt("active", 0)!;
+
+    // inactive layouts stay in the control tree, only the active one is built
+    Widget child = active >= 0 && active < children.length
+        ? KeyedSubtree(
+            key: ValueKey(children[active].id),
+            child: createControl(control, children[active].id, disabled,
+                parentAdaptive: parentAdaptive))
+        : const SizedBox.shrink();
+
+    return constrainedControl(context, child, parent, control);
+  }
+}
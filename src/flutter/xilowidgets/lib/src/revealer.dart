@@ -25,6 +25,8 @@ class _RevealerControlState extends State<RevealerControl>
   late Animation<double> _lengthAnimation;
   late Tween<double> _lengthTween;
   late bool _contentHidden;
+  // server sequence number of the last content_hidden change, echoed in reveal_end
+  late int _revealSeq;
   late Duration _duration;
   late String _orientation;
   late double _maxLength;
@@ -35,6 +37,7 @@ class _RevealerControlState extends State<RevealerControl>
   void initState() {
     super.initState();
     _contentHidden = widget.control.attrBool("content_hidden", false)!;
+    _revealSeq = widget.control.attrInt("revealSeq", 0)!;
     _orientation = widget.control.attrString("orientation", "HORIZONTAL")!;
     _maxLength = widget.control.attrDouble("content_length", 200.0) ?? 200.0;
     _curve = parseCurve(widget.control.attrString("curve", "easeOutBack"))!;
@@ -56,6 +59,16 @@ class _RevealerControlState extends State<RevealerControl>
 
     // Set initial controller value based on content_hidden
     _controller.value = _contentHidden ? 1.0 : 0.0;
+
+    _controller.addStatusListener((status) {
+      if ((status == AnimationStatus.completed ||
+              status == AnimationStatus.dismissed) &&
+          widget.control.attrBool("onRevealEnd", false)!) {
+        var state = _contentHidden ? "hidden" : "revealed";
+        widget.backend.triggerControlEvent(widget.control.id, "reveal_end",
+            _revealSeq > 0 ? "$state:$_revealSeq" : state);
+      }
+    });
   }
 
   void _updateAnimation(double maxLength) {
@@ -81,6 +94,7 @@ class _RevealerControlState extends State<RevealerControl>
         _controller.duration = _duration;
         if (newContentHidden != _contentHidden) {
           _contentHidden = newContentHidden;
+          _revealSeq = widget.control.attrInt("revealSeq", 0)!;
           if (_contentHidden) {
             _controller.forward();
           } else {
@@ -102,9 +116,10 @@ class _RevealerControlState extends State<RevealerControl>
     debugPrint("Revealer build ($hashCode): ${widget.control.id}");
 
     return withPageArgs((context, pageArgs) {
-      var sideBarControl = widget.children
+      // content built by a factory is missing until it is first revealed
+      final sideBarControl = widget.children
           .where((c) => c.name == "content" && c.isVisible)
-          .first;
+          .firstOrNull;
 
       var builder = LayoutBuilder(
         builder: (context, constraints) {
@@ -123,7 +138,7 @@ class _RevealerControlState extends State<RevealerControl>
               AnimatedBuilder(
                 animation: _lengthAnimation,
                 builder: (context, child) {
-                  if (_lengthAnimation.value == 0) {
+                  if (_lengthAnimation.value == 0 || sideBarControl == null) {
                     return const SizedBox.shrink();
                   }
 
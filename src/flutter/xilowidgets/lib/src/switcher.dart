@@ -29,7 +29,8 @@ class _SwitcherControlState extends State<SwitcherControl> with FletStoreMixin,
   @override
   void initState() {
     super.initState();
-    _pageViewController = PageController();
+    _pageViewController = PageController(
+        initialPage: widget.control.attrInt("currentIndex", 0)!);
   }
 
   @override
@@ -66,16 +67,44 @@ class _SwitcherControlState extends State<SwitcherControl> with FletStoreMixin,
 
     bool disabled = widget.control.isDisabled || widget.parentDisabled;
 
-    List<Widget> controls = widget.children.where((c) => c.isVisible).map((c) {
-      return createControl(widget.control, c.id, disabled, parentAdaptive: widget.parentAdaptive);
-    }).toList();
+    int? pageCount = widget.control.attrInt("pageCount");
 
-    var pageView = PageView(
-      controller: _pageViewController,
-      scrollDirection: _scrollDirection,
-      physics: NeverScrollableScrollPhysics(),
-      children: controls,
-    );
+    // every page is held by a "switcherpage" wrapper named after its index
+    Widget buildPage(Control page) {
+      if (page.childIds.isEmpty) {
+        return const SizedBox.shrink();
+      }
+      return createControl(page, page.childIds.first, disabled,
+          parentAdaptive: widget.parentAdaptive);
+    }
+
+    Widget pageView;
+    if (pageCount != null) {
+      // pages built from factories that are not mounted yet are left empty
+      var pages = {for (var c in widget.children) c.name: c};
+      pageView = PageView.builder(
+        controller: _pageViewController,
+        scrollDirection: _scrollDirection,
+        physics: NeverScrollableScrollPhysics(),
+        itemCount: pageCount,
+        itemBuilder: (context, index) {
+          var page = pages[index.toString()];
+          if (page == null || !page.isVisible) {
+            return const SizedBox.shrink();
+          }
+          return buildPage(page);
+        },
+      );
+    } else {
+      List<Widget> controls = widget.children.where((c) => c.isVisible).map(buildPage).toList();
+
+      pageView = PageView(
+        controller: _pageViewController,
+        scrollDirection: _scrollDirection,
+        physics: NeverScrollableScrollPhysics(),
+        children: controls,
+      );
+    }
 
     return constrainedControl(context, pageView, widget.parent, widget.control);
   }
@@ -0,0 +1,99 @@
+import 'dart:convert';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+class TiledImageControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+  final FletControlBackend backend;
+
+  const TiledImageControl({
+    super.key,
+    required this.parent,
+    required this.control,
+    required this.backend,
+  });
+
+  @override
+  State<TiledImageControl> createState() => _TiledImageControlState();
+}
+
+class _TiledImageControlState extends State<TiledImageControl> {
+  // decoded tiles by "level/col/row", dropped only when the server says so
+  final Map<String, MemoryImage> _tiles = {};
+  // tiles of the current view with their rect in full-resolution pixels
+  List<(String, Rect)> _view = [];
+
+  @override
+  void initState() {
+    super.initState();
+    widget.backend.subscribeMethods(widget.control.id, (methodName, args) async {
+      switch (methodName) {
+        case "tiles":
+          _applyTiles(args);
+      }
+      return null;
+    });
+  }
+
+  @override
+  void dispose() {
+    widget.backend.unsubscribeMethods(widget.control.id);
+    for (var tile in _tiles.values) {
+      tile.evict();
+    }
+    super.dispose();
+  }
+
+  void _applyTiles(Map<String, String> args) {
+    for (var key in json.decode(args["evict"] ?? "[]")) {
+      _tiles.remove(key)?.evict();
+    }
+    (json.decode(args["add"] ?? "{}") as Map<String, dynamic>).forEach((key, data) {
+      _tiles[key] = MemoryImage(base64Decode(data));
+    });
+    var view = <(String, Rect)>[];
+    for (var t in json.decode(args["view"] ?? "[]")) {
+      view.add((
+        t[0] as String,
+        Rect.fromLTWH(parseDouble(t[1], 0)!, parseDouble(t[2], 0)!,
+            parseDouble(t[3], 0)!, parseDouble(t[4], 0)!)
+      ));
+    }
+    if (mounted) {
+      setState(() {
+        _view = view;
+      });
+    }
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("TiledImage build: ${widget.control.id}");
+
+    var tiles = <Widget>[];
+    for (var (key, rect) in _view) {
+      var image = _tiles[key];
+      if (image == null) {
+        continue;
+      }
+      tiles.add(Positioned.fromRect(
+        key: ValueKey(key),
+        rect: rect,
+        child: Image(
+          image: image,
+          fit: BoxFit.fill,
+          gaplessPlayback: true,
+          filterQuality: FilterQuality.medium,
+        ),
+      ));
+    }
+
+    return constrainedControl(
+        context,
+        ClipRect(child: Stack(clipBehavior: Clip.none, children: tiles)),
+        widget.parent,
+        widget.control);
+  }
+}
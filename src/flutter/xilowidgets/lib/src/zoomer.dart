@@ -1,3 +1,6 @@
+import 'dart:async';
+import 'dart:convert';
+
 import 'package:flet/flet.dart';
 import 'package:flutter/material.dart';
 import 'package:interactive_viewer_2/interactive_viewer_2.dart';
@@ -8,39 +11,114 @@ class ZoomerControl extends StatefulWidget{
   final List<Control> children;
   final bool parentDisabled;
   final bool? parentAdaptive;
+  final FletControlBackend backend;
 
   const ZoomerControl({
     super.key,
     required this.parent,
     required this.control,
-    required this.children, 
-    required this.parentDisabled, 
-    required this.parentAdaptive
+    required this.children,
+    required this.parentDisabled,
+    required this.parentAdaptive,
+    required this.backend
   });
-  
+
   @override
   State<ZoomerControl> createState() =>  _ZoomerControlState();
 }
 
 class _ZoomerControlState extends State<ZoomerControl> with FletStoreMixin{
+  final TransformationController _transformationController =
+      TransformationController();
+  Size _viewportSize = Size.zero;
+
+  // transform_change throttling: leading report, then the latest one per interval
+  Timer? _transformTimer;
+  bool _transformPending = false;
+  String? _lastTransform;
+
+  @override
+  void initState() {
+    super.initState();
+    _transformationController.addListener(_submitTransform);
+  }
+
+  @override
+  void dispose() {
+    _transformTimer?.cancel();
+    _transformationController.removeListener(_submitTransform);
+    _transformationController.dispose();
+    super.dispose();
+  }
+
+  void _submitTransform() {
+    if (!widget.control.attrBool("onTransformChange", false)!) {
+      return;
+    }
+    if (_transformTimer != null) {
+      _transformPending = true;
+      return;
+    }
+    _sendTransform();
+    var throttle = widget.control.attrInt("transformThrottle", 100)!;
+    _transformTimer = Timer(Duration(milliseconds: throttle), () {
+      _transformTimer = null;
+      if (_transformPending) {
+        _transformPending = false;
+        _submitTransform();
+      }
+    });
+  }
+
+  void _sendTransform() {
+    var topLeft = _transformationController.toScene(Offset.zero);
+    var bottomRight = _transformationController
+        .toScene(Offset(_viewportSize.width, _viewportSize.height));
+    var data = json.encode({
+      "scale": _transformationController.value.getMaxScaleOnAxis(),
+      "x": topLeft.dx,
+      "y": topLeft.dy,
+      "width": bottomRight.dx - topLeft.dx,
+      "height": bottomRight.dy - topLeft.dy,
+    });
+    if (data == _lastTransform) {
+      return;
+    }
+    _lastTransform = data;
+    widget.backend
+        .triggerControlEvent(widget.control.id, "transform_change", data);
+  }
 
   @override
   Widget build(BuildContext context) {
     double minScale = widget.control.attrDouble("minimum_scale", 0.1)!;
     double maxScale = widget.control.attrDouble("maximum_scale", 1)!;
 
-    var contentCtrls =
-        widget.children.where((c) => c.name == "content" && c.isVisible);
+    var contentCtrl = widget.children
+        .where((c) => c.name == "content" && c.isVisible)
+        .firstOrNull;
 
     Widget interactive_viewer = Expanded(
-      child: InteractiveViewer2(
-        child: createControl(widget.control,contentCtrls.first.id, widget.control.isDisabled),
-        maxScale: maxScale,
-        minScale: minScale,
-        clipBehavior: Clip.antiAlias,
-      )
+      child: LayoutBuilder(builder: (context, constraints) {
+        var size = constraints.biggest;
+        if (size != _viewportSize && size.isFinite) {
+          _viewportSize = size;
+          // the visible rect changed without a gesture
+          WidgetsBinding.instance
+              .addPostFrameCallback((_) => _submitTransform());
+        }
+        return InteractiveViewer2(
+          child: contentCtrl != null
+              ? createControl(widget.control, contentCtrl.id, widget.control.isDisabled)
+              : const SizedBox.shrink(),
+          transformationController: _transformationController,
+          maxScale: maxScale,
+          minScale: minScale,
+          clipBehavior: Clip.antiAlias,
+        );
+      })
     );
 
     return constrainedControl(context, interactive_viewer, widget.parent, widget.control);
   }
-}
\ No newline at end of file
+}
@@ -1,8 +1,18 @@
 from xilowidgets.revealer import Revealer
-from xilowidgets.zoomer import Zoomer
+from xilowidgets.revealergroup import RevealerGroup, RevealerTransition
+from xilowidgets.accordion import Accordion
+from xilowidgets.zoomer import Zoomer, ZoomerTransform, ZoomerTransformChangeEvent, ZoomerVariant
+from xilowidgets.tiledimage import TiledImage, TilePyramid
 from xilowidgets.editor import Editor, EditorTheme
 from xilowidgets.switcher import Switcher
 from xilowidgets.drawboard import Drawboard
-from xilowidgets.mediaquery import MediaQuery, MediaQuerySizeChangeEvent
-from xilowidgets.xdialog import XDialog
-from xilowidgets.xdropdown import XDropdown
\ No newline at end of file
+from xilowidgets.mediaquery import MediaQuery, MediaQueryBreakpoint, MediaQueryBreakpointChangeEvent, MediaQueryMetrics, MediaQueryMetricsChangeEvent, MediaQueryRatePolicy, MediaQuerySizeChangeEvent
+from xilowidgets.responsive import Responsive
+from xilowidgets.imagesource import ImageSourcePicker, ImageVariant, ImageVariantCache
+from xilowidgets.xdialog import XDialog, XDialogSweeper
+from xilowidgets.xdialogpool import XDialogPool
+from xilowidgets.xdropdown import XDropdown
+from xilowidgets.graphview import GraphView, GraphLayoutEndEvent, ForceLayout
+from xilowidgets.snapshot import SnapshotError
+from xilowidgets.sharedscene import SharedScene
+from xilowidgets.history import EditHistory, EditTransaction
\ No newline at end of file
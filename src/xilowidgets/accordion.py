@@ -0,0 +1,287 @@
+import bisect
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from flet.core.animation import AnimationCurve
+from flet.core.column import Column
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.container import Container
+from flet.core.control import Control, OptionalNumber
+from flet.core.control_event import ControlEvent
+from flet.core.ref import Ref
+from flet.core.types import ResponsiveNumber
+
+from xilowidgets.revealer import Revealer
+
+
+class Accordion(ConstrainedControl):
+    """
+    Virtualized list of expandable rows.
+
+    Only the rows inside the scrolled window plus `buffer` rows on each side
+    exist as controls. Every row has a header of `item_extent` pixels and a
+    Revealer holding `content_length` pixels of content, built by
+    `header_builder(index)` and `content_builder(index)`; the content is only
+    built once the row is expanded. Row controls that scroll out of the
+    window are hidden and rebound to the rows scrolling in, so they are never
+    sent to the client again; which rows are expanded is stored by index,
+    independently of the controls. The client reports its scroll offset in
+    steps of one header, and each step causes at most one update.
+    """
+
+    def __init__(
+        self,
+        item_count: int,
+        header_builder: Callable[[int], Control],
+        content_builder: Callable[[int], Control],
+        item_extent: float = 48,
+        content_length: float = 200,
+        buffer: int = 10,
+        expanded: Optional[Iterable[int]] = None,
+        animation_duration: OptionalNumber = None,
+        animation_curve: Optional[AnimationCurve] = None,
+        #
+        # ConstrainedControl
+        #
+        ref: Optional[Ref] = None,
+        key: Optional[str] = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        expand_loose: Optional[bool] = None,
+        col: Optional[ResponsiveNumber] = None,
+        opacity: OptionalNumber = None,
+        visible: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        data: Any = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            key=key,
+            width=width,
+            height=height,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            expand=expand,
+            expand_loose=expand_loose,
+            col=col,
+            opacity=opacity,
+            visible=visible,
+            disabled=disabled,
+            data=data,
+        )
+
+        self.header_builder = header_builder
+        self.content_builder = content_builder
+        self.item_extent = item_extent
+        self.content_length = content_length
+        self.buffer = buffer
+        self.animation_duration = animation_duration
+        self.animation_curve = animation_curve
+        self.__lock = threading.RLock()
+        self.__expanded: List[int] = sorted(set(expanded or ()))
+        self.__rows: Dict[int, _AccordionRow] = {}
+        # all row controls in a stable order, so recycling never reorders children
+        self.__pool: List[_AccordionRow] = []
+        self.__offset = 0.0
+        self.__viewport = float(height) if height else 800.0
+        self.item_count = item_count
+        self._add_event_handler("scroll", self.__on_scroll)
+
+    def _get_control_name(self):
+        return "accordion"
+
+    def before_update(self):
+        super().before_update()
+        with self.__lock:
+            self.__layout()
+        self._set_attr("extent", self.extent)
+        self._set_attr("scrollStep", self.item_extent)
+
+    def _get_children(self):
+        return self.__pool
+
+    # layout
+    def top_of(self, index: int) -> float:
+        """Offset of a row from the top of the list."""
+        return index * self.item_extent + self.content_length * bisect.bisect_left(
+            self.__expanded, index
+        )
+
+    def index_at(self, offset: float) -> int:
+        """Index of the row at `offset` pixels from the top of the list."""
+        lo, hi = 0, self.__item_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.top_of(mid + 1) <= offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        return min(lo, max(self.__item_count - 1, 0))
+
+    @property
+    def extent(self) -> float:
+        """Total height of the list."""
+        return self.__item_count * self.item_extent + self.content_length * len(self.__expanded)
+
+    @property
+    def visible_range(self) -> range:
+        """Indices of the rows that currently exist as controls."""
+        if self.__item_count == 0:
+            return range(0)
+        first = max(self.index_at(self.__offset) - self.buffer, 0)
+        last = min(self.index_at(self.__offset + self.__viewport) + self.buffer, self.__item_count - 1)
+        return range(first, last + 1)
+
+    def __layout(self) -> bool:
+        window = self.visible_range
+        changed = False
+        for index in [i for i in self.__rows if i not in window]:
+            self.__rows.pop(index).release()
+            changed = True
+        free = [row for row in self.__pool if row.index is None]
+        for index in window:
+            row = self.__rows.get(index)
+            if row is None:
+                if free:
+                    row = free.pop()
+                else:
+                    row = _AccordionRow(self)
+                    self.__pool.append(row)
+                row.bind(index)
+                self.__rows[index] = row
+                changed = True
+            row.place(self.top_of(index), index in self.__expanded_set)
+        # keep a few spare rows for the next scroll step, drop the rest
+        for row in free[self.buffer * 2 :]:
+            self.__pool.remove(row)
+        return changed
+
+    def __on_scroll(self, e: ControlEvent):
+        d = json.loads(e.data)
+        with self.__lock:
+            self.__offset = float(d.get("offset", 0))
+            self.__viewport = float(d.get("viewport", self.__viewport))
+            changed = self.__layout()
+        if changed:
+            self.update()
+
+    # expanded state
+    @property
+    def expanded(self) -> Set[int]:
+        return set(self.__expanded)
+
+    def is_expanded(self, index: int) -> bool:
+        return index in self.__expanded_set
+
+    def expand_row(self, index: int):
+        self.__set_expanded(index, True)
+
+    def collapse_row(self, index: int):
+        self.__set_expanded(index, False)
+
+    def toggle_row(self, index: int):
+        self.__set_expanded(index, not self.is_expanded(index))
+
+    def __set_expanded(self, index: int, value: bool):
+        with self.__lock:
+            if value == (index in self.__expanded_set):
+                return
+            if value:
+                bisect.insort(self.__expanded, index)
+                self.__expanded_set.add(index)
+            else:
+                self.__expanded.pop(bisect.bisect_left(self.__expanded, index))
+                self.__expanded_set.discard(index)
+            self.__layout()
+        if self.page is not None:
+            self.update()
+
+    # item_count
+    @property
+    def item_count(self) -> int:
+        return self.__item_count
+
+    @item_count.setter
+    def item_count(self, value: int):
+        with self.__lock:
+            self.__item_count = value
+            self.__expanded = [i for i in self.__expanded if i < value]
+            self.__expanded_set = set(self.__expanded)
+            # rebind the materialized rows, their content may have changed
+            for row in self.__rows.values():
+                row.release()
+            self.__rows.clear()
+
+    # animation_duration
+    @property
+    def animation_duration(self) -> OptionalNumber:
+        return self._get_attr("animationDuration")
+
+    @animation_duration.setter
+    def animation_duration(self, value: OptionalNumber):
+        self._set_attr("animationDuration", value)
+
+    # animation_curve
+    @property
+    def animation_curve(self) -> Optional[AnimationCurve]:
+        return self.__animation_curve
+
+    @animation_curve.setter
+    def animation_curve(self, value: Optional[AnimationCurve]):
+        self.__animation_curve = value
+        self._set_enum_attr("curve", value, AnimationCurve)
+
+
+class _AccordionRow(Control):
+    """A recyclable row: a clickable header above a vertical Revealer."""
+
+    def __init__(self, accordion: Accordion):
+        Control.__init__(self)
+        self.accordion = accordion
+        self.index: Optional[int] = None
+        self.header = Container(height=accordion.item_extent, on_click=self.__on_click)
+        self.revealer = Revealer(
+            content_hidden=True,
+            orientation=Revealer.Orientation.VERTICAL,
+            content_length=accordion.content_length,
+            animation_duration=accordion.animation_duration,
+            animation_curve=accordion.animation_curve,
+        )
+        self.column = Column([self.header, self.revealer], spacing=0)
+
+    def _get_control_name(self):
+        return "accordionrow"
+
+    def _get_children(self):
+        return [self.column]
+
+    def bind(self, index: int):
+        if index == self.index:
+            return
+        self.index = index
+        self.header.content = self.accordion.header_builder(index)
+        self.revealer.content = None
+        self.revealer.content_factory = lambda: self.accordion.content_builder(index)
+        self._set_attr("index", index)
+        self.visible = True
+
+    def release(self):
+        self.index = None
+        self.visible = False
+
+    def place(self, top: float, expanded: bool):
+        self._set_attr("top", top)
+        self.revealer.content_hidden = not expanded
+
+    def __on_click(self, e):
+        if self.index is not None:
+            self.accordion.toggle_row(self.index)
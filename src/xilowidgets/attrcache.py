@@ -0,0 +1,182 @@
+import copy
+import dataclasses
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from flet.core.control import Control
+from flet.core.embed_json_encoder import EmbedJsonEncoder
+from flet.core.types import ControlState
+
+
+class JsonCache:
+    """
+    Bounded, process-wide cache of encoded attribute values.
+
+    Values are looked up by identity: an object that was encoded before and
+    still equals the copy taken at that time is a hit, so a `Theme`,
+    `TextStyle`, `Border`, ... shared by many controls is encoded and copied
+    once. A mutated object fails the equality check and is encoded again.
+    Immutable values (enums, flat tuples, frozen dataclasses) are keyed by
+    value instead, so equal copies of them share one encoding too.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__lock = threading.Lock()
+        # id(value) -> (ref to value, snapshot, json)
+        self.__by_id: "OrderedDict[int, Tuple[Callable[[], Any], Any, str]]" = OrderedDict()
+        self.__by_value: "OrderedDict[Hashable, str]" = OrderedDict()
+
+    def encode(self, value: Any) -> Optional[str]:
+        return self.encode_with_snapshot(value)[0]
+
+    def encode_with_snapshot(self, value: Any) -> Tuple[Optional[str], Any]:
+        """
+        Returns the JSON of `value` and a snapshot that can later be compared
+        with `==` to find out whether `value` was mutated since.
+        """
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return _dumps(value) if value is not None else None, value
+
+        key = id(value)
+        with self.__lock:
+            entry = self.__by_id.get(key)
+            if entry is not None and entry[0]() is value and entry[1] == value:
+                self.__by_id.move_to_end(key)
+                self.hits += 1
+                return entry[2], entry[1]
+
+        value_key = _value_key(value)
+        if value_key is not None:
+            # immutable values are their own snapshot
+            with self.__lock:
+                encoded = self.__by_value.get(value_key)
+                if encoded is not None:
+                    self.__by_value.move_to_end(value_key)
+                    self.hits += 1
+                    return encoded, value
+                self.misses += 1
+            encoded = _dumps(value)
+            with self.__lock:
+                self.__by_value[value_key] = encoded
+                self.__trim(self.__by_value)
+            return encoded, value
+
+        encoded = _dumps(value)
+        snapshot = _snapshot(value)
+        with self.__lock:
+            self.misses += 1
+            if snapshot is not _UNCOPYABLE:
+                self.__by_id[key] = (_ref(value), snapshot, encoded)
+                self.__trim(self.__by_id)
+        return encoded, snapshot
+
+    def clear(self):
+        with self.__lock:
+            self.__by_id.clear()
+            self.__by_value.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.__by_id) + len(self.__by_value),
+            }
+
+    def __trim(self, entries: OrderedDict):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+
+json_cache = JsonCache()
+
+
+class CachedJsonAttrs:
+    """
+    Mixin for controls that set complex properties with `_set_attr_json` in
+    `before_update`.
+
+    A property is only encoded again when its value changed since the last
+    update: either another object was assigned or the same object no longer
+    equals the copy taken when it was last encoded, which catches in-place
+    mutations such as `control.border.top = ...`. Changed values are encoded
+    through the shared `json_cache`.
+    """
+
+    def _set_attr_json(self, name: str, value: Any, wrap_attr_dict: bool = False) -> None:
+        cache: Dict[str, Tuple[Any, Any]] = self.__dict__.setdefault("_json_attr_cache", {})
+        entry = cache.get(name)
+        if entry is not None and entry[0] is value and entry[1] == value:
+            return
+        if wrap_attr_dict and value is not None and not isinstance(value, dict):
+            # the wrapping dict is new every time, look up the wrapped value instead
+            nv, snapshot = json_cache.encode_with_snapshot(value)
+            nv = nv and f'{{"{ControlState.DEFAULT.value}":{nv}}}'
+        else:
+            nv, snapshot = json_cache.encode_with_snapshot(value)
+        if self._get_attr(name) != nv:
+            self._set_attr(name, nv)
+        if snapshot is not _UNCOPYABLE:
+            cache[name] = (value, snapshot)
+        else:
+            cache.pop(name, None)
+
+
+_UNCOPYABLE = object()
+
+
+def _dumps(value: Any) -> str:
+    if isinstance(value, Enum):
+        # EmbedJsonEncoder only converts enums nested in dicts
+        value = value.value
+    return json.dumps(value, cls=EmbedJsonEncoder, separators=(",", ":"))
+
+
+def _snapshot(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Control):
+        return _UNCOPYABLE
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return _UNCOPYABLE
+
+
+def _value_key(value: Any) -> Optional[Hashable]:
+    """
+    Key of an immutable value, or None if it has to be cached by identity.
+    Types are part of the key, since `(1,)`, `(1.0,)` and `(True,)` are equal
+    but encode differently.
+    """
+    if isinstance(value, Enum):
+        return (type(value), value)
+    if isinstance(value, tuple):
+        if all(v is None or isinstance(v, (str, int, float, bool, Enum)) for v in value):
+            return (tuple, tuple(type(v) for v in value), value)
+        return None
+    if dataclasses.is_dataclass(value) and value.__dataclass_params__.frozen:
+        fields = tuple(getattr(value, f.name) for f in dataclasses.fields(value))
+        if not all(v is None or isinstance(v, (str, int, float, bool, Enum)) for v in fields):
+            # nested or unhashable fields, e.g. lists, are not keyed by value
+            return None
+        return (type(value), tuple(type(v) for v in fields), fields)
+    return None
+
+
+def _ref(value: Any):
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        # dicts and lists cannot be weakly referenced, keep them alive instead
+        return lambda: value
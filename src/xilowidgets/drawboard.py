@@ -1,13 +1,21 @@
+import asyncio
+import base64
 import json
+import os
+import sys
+from array import array
 from typing import Any, List, Optional, Union
 
 from flet.core.animation import AnimationValue
+from flet.core.canvas.points import PointMode, Points
 from flet.core.canvas.shape import Shape
 from flet.core.constrained_control import ConstrainedControl
 from flet.core.control import Control, OptionalNumber
 from flet.core.control_event import ControlEvent
 from flet.core.event_handler import EventHandler
+from flet.core.painting import Paint, PaintingStyle
 from flet.core.ref import Ref
+from flet.core.transform import Offset
 from flet.core.types import (
     OffsetValue,
     OptionalControlEventCallable,
@@ -17,14 +25,28 @@ from flet.core.types import (
     ScaleValue,
 )
 
+from xilowidgets import snapshot
+from xilowidgets.attrcache import CachedJsonAttrs
+from xilowidgets.history import EditHistory, EditTransaction
+from xilowidgets.sharedscene import SharedScene
 
-class Drawboard(ConstrainedControl):
+
+class Drawboard(CachedJsonAttrs, ConstrainedControl):
     def __init__(
         self,
         shapes: Optional[List[Shape]] = None,
         content: Optional[Control] = None,
         resize_interval: OptionalNumber = None,
         on_resize=None,
+        stroke_capture: Optional[bool] = None,
+        stroke_interval: OptionalNumber = None,
+        stroke_paint: Optional[Paint] = None,
+        commit_strokes: bool = True,
+        on_stroke: OptionalEventCallable["DrawboardStrokeEvent"] = None,
+        on_stroke_end: OptionalEventCallable["DrawboardStrokeEvent"] = None,
+        scene: Optional[SharedScene] = None,
+        history_budget: Optional[int] = None,
+        history_coalesce: OptionalNumber = None,
         #
         # ConstrainedControl
         #
@@ -87,16 +109,50 @@ class Drawboard(ConstrainedControl):
         self.__on_resize = EventHandler(lambda e: DrawboardResizeEvent(e))
         self._add_event_handler("resize", self.__on_resize.get_handler())
 
+        self.__on_stroke = EventHandler(lambda e: DrawboardStrokeEvent(e))
+        self._add_event_handler("stroke", self.__on_stroke.get_handler())
+
+        self.__on_stroke_end = EventHandler()
+        self._add_event_handler("stroke_end", self.__handle_stroke_end)
+
+        self.__history = EditHistory(self)
+        if history_budget is not None:
+            self.__history.memory_budget = history_budget
+        if history_coalesce is not None:
+            self.__history.coalesce_interval = history_coalesce
+
         self.shapes = shapes
         self.content = content
         self.resize_interval = resize_interval
         self.on_resize = on_resize
+        self.stroke_capture = stroke_capture
+        self.stroke_interval = stroke_interval
+        self.stroke_paint = stroke_paint
+        self.commit_strokes = commit_strokes
+        self.on_stroke = on_stroke
+        self.on_stroke_end = on_stroke_end
+        self.__scene: Optional[SharedScene] = None
+        self.scene = scene
 
         self.on_capture = on_capture
 
     def _get_control_name(self):
         return "drawboard"
 
+    def before_update(self):
+        super().before_update()
+        self._set_attr_json("strokePaint", self.__stroke_paint)
+
+    def did_mount(self):
+        super().did_mount()
+        if self.__scene is not None:
+            self.__scene.subscribe(self)
+
+    def will_unmount(self):
+        if self.__scene is not None:
+            self.__scene.unsubscribe(self)
+        super().will_unmount()
+
     def _get_children(self):
         children = []
         children.extend(self.__shapes)
@@ -109,6 +165,40 @@ class Drawboard(ConstrainedControl):
         super().clean()
         self.__shapes.clear()
 
+    def edit(self, label: Optional[str] = None) -> EditTransaction:
+        """
+        Starts an undoable group of shape edits:
+
+        ```
+        with drawboard.edit() as tx:
+            tx.add(cv.Circle(10, 10, 5))
+            tx.modify(line, x2=100, y2=40)
+        ```
+        """
+        return EditTransaction(self.__history, label)
+
+    def undo(self) -> bool:
+        return self.__history.undo()
+
+    def redo(self) -> bool:
+        return self.__history.redo()
+
+    @property
+    def history(self) -> EditHistory:
+        return self.__history
+
+    def save_snapshot(self, path: Union[str, os.PathLike]):
+        """Writes `shapes` to `path` in the columnar format of `xilowidgets.snapshot`."""
+        snapshot.save_snapshot(path, self.__shapes)
+
+    def load_snapshot(self, path: Union[str, os.PathLike]):
+        """
+        Replaces `shapes` with the ones stored in `path` and clears the edit
+        history. Call `update()` to send them.
+        """
+        self.__shapes = snapshot.load_snapshot(path)
+        self.__history.clear()
+
     # shapes
     @property
     def shapes(self) -> List[Shape]:
@@ -117,6 +207,8 @@ class Drawboard(ConstrainedControl):
     @shapes.setter
     def shapes(self, value: Optional[List[Shape]]):
         self.__shapes = value if value is not None else []
+        # recorded edits refer to the replaced list
+        self.__history.clear()
 
     # content
     @property
@@ -127,6 +219,23 @@ class Drawboard(ConstrainedControl):
     def content(self, value: Optional[Control]):
         self.__content = value
 
+    # scene
+    @property
+    def scene(self) -> Optional[SharedScene]:
+        """Shared shapes drawn beneath `shapes`; they are streamed to the client by the scene itself."""
+        return self.__scene
+
+    @scene.setter
+    def scene(self, value: Optional[SharedScene]):
+        previous = self.__scene
+        self.__scene = value
+        if previous is value or self.page is None:
+            return
+        if previous is not None:
+            previous.unsubscribe(self)
+        if value is not None:
+            value.subscribe(self)
+
     # resize_interval
     @property
     def resize_interval(self) -> OptionalNumber:
@@ -136,6 +245,86 @@ class Drawboard(ConstrainedControl):
     def resize_interval(self, value: OptionalNumber):
         self._set_attr("resizeInterval", value)
 
+    # stroke_capture
+    @property
+    def stroke_capture(self) -> Optional[bool]:
+        return self._get_attr("strokeCapture", data_type="bool", def_value=False)
+
+    @stroke_capture.setter
+    def stroke_capture(self, value: Optional[bool]):
+        self._set_attr("strokeCapture", value)
+
+    # stroke_interval
+    @property
+    def stroke_interval(self) -> OptionalNumber:
+        """Milliseconds between batched `stroke` packets while a stroke is drawn."""
+        return self._get_attr("strokeInterval")
+
+    @stroke_interval.setter
+    def stroke_interval(self, value: OptionalNumber):
+        self._set_attr("strokeInterval", value)
+
+    # stroke_paint
+    @property
+    def stroke_paint(self) -> Optional[Paint]:
+        return self.__stroke_paint
+
+    @stroke_paint.setter
+    def stroke_paint(self, value: Optional[Paint]):
+        self.__stroke_paint = value
+
+    # commit_strokes
+    @property
+    def commit_strokes(self) -> bool:
+        """
+        Append every finished stroke to `shapes` as a single `Points` shape.
+        When off, the client stops drawing a stroke once it reported `stroke_end`.
+        """
+        return self._get_attr("commitStrokes", data_type="bool", def_value=True)
+
+    @commit_strokes.setter
+    def commit_strokes(self, value: bool):
+        self._set_attr("commitStrokes", value)
+
+    # on_stroke
+    @property
+    def on_stroke(self) -> OptionalEventCallable["DrawboardStrokeEvent"]:
+        return self.__on_stroke.handler
+
+    @on_stroke.setter
+    def on_stroke(self, handler: OptionalEventCallable["DrawboardStrokeEvent"]):
+        self.__on_stroke.handler = handler
+        self._set_attr("onStroke", True if handler is not None else None)
+
+    # on_stroke_end
+    @property
+    def on_stroke_end(self) -> OptionalEventCallable["DrawboardStrokeEvent"]:
+        return self.__on_stroke_end.handler
+
+    @on_stroke_end.setter
+    def on_stroke_end(self, handler: OptionalEventCallable["DrawboardStrokeEvent"]):
+        self.__on_stroke_end.handler = handler
+
+    def __handle_stroke_end(self, e: ControlEvent):
+        event = DrawboardStrokeEvent(e)
+        if self.commit_strokes and len(event.xs) > 0:
+            event.shape = Points(
+                points=[Offset(x, y) for x, y in zip(event.xs, event.ys)],
+                point_mode=PointMode.POLYGON if len(event.xs) > 1 else PointMode.POINTS,
+                paint=self.__stroke_paint
+                or Paint(stroke_width=2, style=PaintingStyle.STROKE),
+            )
+            # lets the client drop its local copy of this stroke
+            event.shape._set_attr("strokeId", event.stroke_id)
+            with self.edit("stroke") as tx:
+                tx.add(event.shape)
+        handler = self.__on_stroke_end.handler
+        if handler is not None:
+            if asyncio.iscoroutinefunction(handler):
+                e.page.run_task(handler, event)
+            else:
+                handler(event)
+
     @property
     def on_capture(self):
         return self._get_event_handler("captured")
@@ -169,4 +358,25 @@ class DrawboardResizeEvent(ControlEvent):
         super().__init__(e.target, e.name, e.data, e.control, e.page)
         d = json.loads(e.data)
         self.width: float = d.get("w")
-        self.height: float = d.get("h")
\ No newline at end of file
+        self.height: float = d.get("h")
+
+
+class DrawboardStrokeEvent(ControlEvent):
+    """
+    A batch of pointer samples. `stroke` events carry the samples captured since
+    the previous packet, `stroke_end` carries the whole finished stroke.
+    """
+
+    def __init__(self, e: ControlEvent) -> None:
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        d = json.loads(e.data)
+        self.stroke_id: int = d.get("id")
+        n = d.get("n", 0)
+        packed = array("f", base64.b64decode(d.get("d", "")))
+        if sys.byteorder != "little":
+            packed.byteswap()
+        self.xs: List[float] = packed[0:n].tolist()
+        self.ys: List[float] = packed[n : 2 * n].tolist()
+        self.pressures: List[float] = packed[2 * n : 3 * n].tolist()
+        self.times: List[float] = packed[3 * n : 4 * n].tolist()
+        self.shape: Optional[Points] = None
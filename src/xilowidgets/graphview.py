@@ -0,0 +1,425 @@
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from flet.core.animation import AnimationValue
+from flet.core.canvas.circle import Circle
+from flet.core.canvas.line import Line
+from flet.core.control import OptionalNumber
+from flet.core.control_event import ControlEvent
+from flet.core.painting import Paint
+from flet.core.ref import Ref
+from flet.core.types import (
+    OffsetValue,
+    OptionalControlEventCallable,
+    ResponsiveNumber,
+    RotateValue,
+    ScaleValue,
+)
+
+from xilowidgets.drawboard import Drawboard
+
+# spreads the push directions of coincident nodes evenly around the circle
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+# coincident nodes are pushed apart as if they were this fraction of k apart
+_MIN_DISTANCE = 0.01
+
+
+class ForceLayout:
+    """
+    Fruchterman-Reingold layout with Barnes-Hut approximated repulsion.
+
+    Positions are kept in an (n, 2) NumPy array and advanced one iteration per
+    `step()` call, so the caller decides when to render between iterations.
+    """
+
+    def __init__(
+        self,
+        node_count: int,
+        edges: Sequence[Tuple[int, int]],
+        width: float = 1000.0,
+        height: float = 1000.0,
+        theta: float = 0.8,
+        gravity: float = 0.05,
+        cooling: float = 0.95,
+        seed: Optional[int] = None,
+    ):
+        if np is None:
+            raise ImportError(
+                "ForceLayout requires numpy, install it with `pip install xilowidgets[graph]`"
+            )
+        self.node_count = node_count
+        self.width = float(width)
+        self.height = float(height)
+        self.theta = theta
+        self.gravity = gravity
+        self.cooling = cooling
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.positions = np.random.default_rng(seed).random((node_count, 2)) * (
+            self.width,
+            self.height,
+        )
+        self.k = math.sqrt(self.width * self.height / max(node_count, 1))
+        self.temperature = max(self.width, self.height) / 10
+        self.depth = min(10, max(1, math.ceil(math.log(max(node_count, 2), 4))))
+        self.iterations = 0
+        self.energy = math.inf
+
+    def step(self) -> float:
+        """Runs one iteration and returns the mean node displacement."""
+        if self.node_count == 0:
+            self.energy = 0.0
+            return 0.0
+        pos = self.positions
+        disp = self._repulsion() + self._attraction()
+        disp -= (pos - (self.width / 2, self.height / 2)) * self.gravity
+
+        length = np.hypot(disp[:, 0], disp[:, 1])
+        np.maximum(length, 1e-9, out=length)
+        capped = np.minimum(length, self.temperature)
+        pos += disp * (capped / length)[:, None]
+        np.clip(pos[:, 0], 0, self.width, out=pos[:, 0])
+        np.clip(pos[:, 1], 0, self.height, out=pos[:, 1])
+
+        self.temperature *= self.cooling
+        self.iterations += 1
+        self.energy = float(np.dot(capped, capped))
+        return math.sqrt(self.energy / self.node_count)
+
+    def _attraction(self):
+        force = np.zeros_like(self.positions)
+        if len(self.edges) == 0:
+            return force
+        src, dst = self.edges[:, 0], self.edges[:, 1]
+        delta = self.positions[src] - self.positions[dst]
+        f = delta * (np.hypot(delta[:, 0], delta[:, 1]) / self.k)[:, None]
+        n = self.node_count
+        for axis in (0, 1):
+            force[:, axis] -= np.bincount(src, weights=f[:, axis], minlength=n)
+            force[:, axis] += np.bincount(dst, weights=f[:, axis], minlength=n)
+        return force
+
+    def _repulsion(self):
+        pos = self.positions
+        n = self.node_count
+        lo = pos.min(axis=0)
+        span = max(float((pos.max(axis=0) - lo).max()), 1e-9) * (1 + 1e-9)
+
+        # quadtree as one dense grid per level: cell mass and coordinate sums
+        levels = []
+        for level in range(self.depth + 1):
+            size = 1 << level
+            cells = np.minimum(((pos - lo) * (size / span)).astype(np.int64), size - 1)
+            ids = cells[:, 1] * size + cells[:, 0]
+            levels.append(
+                (
+                    ids,
+                    np.bincount(ids, minlength=size * size).astype(np.float64),
+                    np.bincount(ids, weights=pos[:, 0], minlength=size * size),
+                    np.bincount(ids, weights=pos[:, 1], minlength=size * size),
+                )
+            )
+
+        force = np.zeros_like(pos)
+        node = np.arange(n)
+        cell = np.zeros(n, dtype=np.int64)
+        for level in range(self.depth + 1):
+            size = 1 << level
+            ids, mass, sum_x, sum_y = levels[level]
+            m = mass[cell]
+            keep = m > 0
+            node, cell, m = node[keep], cell[keep], m[keep]
+            cx, cy = sum_x[cell] / m, sum_y[cell] / m
+            dist = np.hypot(pos[node, 0] - cx, pos[node, 1] - cy)
+            accept = (ids[node] != cell) & (span / size < self.theta * dist)
+
+            self._apply_repulsion(force, node[accept], cx[accept], cy[accept], m[accept])
+            node, cell = node[~accept], cell[~accept]
+
+            if level == self.depth:
+                # leaves that are too close are resolved point by point
+                order = np.argsort(ids, kind="stable")
+                starts = np.cumsum(mass) - mass
+                counts = mass[cell].astype(np.int64)
+                total = int(counts.sum())
+                within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                other = order[np.repeat(starts[cell].astype(np.int64), counts) + within]
+                node = np.repeat(node, counts)
+                keep = other != node
+                node, other = node[keep], other[keep]
+                self._apply_repulsion(
+                    force, node, pos[other, 0], pos[other, 1], np.ones(len(node))
+                )
+                break
+            ix, iy = cell % size, cell // size
+            child = 2 * size
+            node = np.repeat(node, 4)
+            cell = np.stack(
+                [
+                    (2 * iy) * child + 2 * ix,
+                    (2 * iy) * child + 2 * ix + 1,
+                    (2 * iy + 1) * child + 2 * ix,
+                    (2 * iy + 1) * child + 2 * ix + 1,
+                ],
+                axis=1,
+            ).reshape(-1)
+        return force
+
+    def _apply_repulsion(self, force, node, x, y, mass):
+        delta = np.empty((len(node), 2))
+        delta[:, 0] = self.positions[node, 0] - x
+        delta[:, 1] = self.positions[node, 1] - y
+        d2 = delta[:, 0] ** 2 + delta[:, 1] ** 2
+        same = d2 < 1e-12
+        if same.any():
+            # coincident nodes would never separate; push each along a fixed,
+            # node-dependent direction so the layout stays deterministic
+            angle = node[same] * _GOLDEN_ANGLE
+            eps = _MIN_DISTANCE * self.k
+            delta[same, 0] = np.cos(angle) * eps
+            delta[same, 1] = np.sin(angle) * eps
+            d2[same] = eps * eps
+        np.maximum(d2, 1e-6, out=d2)
+        f = delta * (self.k * self.k * mass / d2)[:, None]
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(node, weights=f[:, axis], minlength=self.node_count)
+
+
+class GraphView(Drawboard):
+    """
+    Draws a node-link graph on a Drawboard and lays it out in the background.
+
+    Layout iterations run on a worker thread; node and edge positions are pushed
+    to the client at most `max_fps` times per second and the layout stops once
+    the mean node displacement drops below `tolerance * k` or `max_iterations`
+    is reached.
+    """
+
+    def __init__(
+        self,
+        nodes: Union[None, int, Sequence[Hashable]] = None,
+        edges: Optional[Sequence[Tuple[Hashable, Hashable]]] = None,
+        node_radius: OptionalNumber = None,
+        node_paint: Optional[Paint] = None,
+        edge_paint: Optional[Paint] = None,
+        layout_width: OptionalNumber = None,
+        layout_height: OptionalNumber = None,
+        theta: float = 0.8,
+        max_fps: float = 30,
+        max_iterations: int = 500,
+        tolerance: float = 1e-3,
+        seed: Optional[int] = None,
+        autostart: bool = True,
+        on_layout_end: Optional[Callable[["GraphLayoutEndEvent"], None]] = None,
+        #
+        # ConstrainedControl
+        #
+        ref: Optional[Ref] = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        expand_loose: Optional[bool] = None,
+        col: Optional[ResponsiveNumber] = None,
+        opacity: OptionalNumber = None,
+        rotate: Optional[RotateValue] = None,
+        scale: Optional[ScaleValue] = None,
+        offset: Optional[OffsetValue] = None,
+        aspect_ratio: OptionalNumber = None,
+        animate_opacity: Optional[AnimationValue] = None,
+        animate_size: Optional[AnimationValue] = None,
+        animate_position: Optional[AnimationValue] = None,
+        animate_rotation: Optional[AnimationValue] = None,
+        animate_scale: Optional[AnimationValue] = None,
+        animate_offset: Optional[AnimationValue] = None,
+        on_animation_end: OptionalControlEventCallable = None,
+        visible: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        data: Any = None,
+    ):
+        Drawboard.__init__(
+            self,
+            ref=ref,
+            width=width,
+            height=height,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            expand=expand,
+            expand_loose=expand_loose,
+            col=col,
+            opacity=opacity,
+            rotate=rotate,
+            scale=scale,
+            offset=offset,
+            aspect_ratio=aspect_ratio,
+            animate_opacity=animate_opacity,
+            animate_size=animate_size,
+            animate_position=animate_position,
+            animate_rotation=animate_rotation,
+            animate_scale=animate_scale,
+            animate_offset=animate_offset,
+            on_animation_end=on_animation_end,
+            visible=visible,
+            disabled=disabled,
+            data=data,
+        )
+
+        self.node_radius = node_radius if node_radius is not None else 4
+        self.node_paint = node_paint
+        self.edge_paint = edge_paint
+        self.layout_width = layout_width if layout_width is not None else (width or 1000)
+        self.layout_height = layout_height if layout_height is not None else (height or 1000)
+        self.theta = theta
+        self.max_fps = max_fps
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.seed = seed
+        self.autostart = autostart
+        self.on_layout_end = on_layout_end
+
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__frames = 0
+        self.set_graph(nodes, edges)
+
+    def did_mount(self):
+        super().did_mount()
+        if self.autostart:
+            self.start()
+
+    def will_unmount(self):
+        # may run inside page updates, so never wait for a worker blocked in update()
+        self.stop(wait=False)
+        super().will_unmount()
+
+    def set_graph(
+        self,
+        nodes: Union[None, int, Sequence[Hashable]],
+        edges: Optional[Sequence[Tuple[Hashable, Hashable]]],
+    ):
+        """Replaces the graph and rebuilds node/edge shapes. Stops a running layout."""
+        self.stop()
+        if nodes is None:
+            nodes = []
+        elif isinstance(nodes, int):
+            nodes = range(nodes)
+        self.__keys: List[Hashable] = list(nodes)
+        index = {key: i for i, key in enumerate(self.__keys)}
+        pairs = [(index[a], index[b]) for a, b in (edges or [])]
+
+        self.__layout = ForceLayout(
+            len(self.__keys),
+            pairs,
+            width=self.layout_width,
+            height=self.layout_height,
+            theta=self.theta,
+            seed=self.seed,
+        )
+        self.__pairs = pairs
+        self.__circles = [
+            Circle(radius=self.node_radius, paint=self.node_paint) for _ in self.__keys
+        ]
+        self.__lines = [Line(paint=self.edge_paint) for _ in pairs]
+        self.__apply_positions()
+        # edges first so nodes are painted on top of them
+        self.shapes = [*self.__lines, *self.__circles]
+
+    def start(self):
+        """Starts (or resumes) the background layout."""
+        with self.__lock:
+            if self.__thread is not None and self.__thread.is_alive() and not self.__stop.is_set():
+                return
+            # every worker gets its own flag, so one that is still winding down stays stopped
+            self.__stop = threading.Event()
+            self.__thread = threading.Thread(target=self.__run, args=(self.__stop,), daemon=True)
+            self.__thread.start()
+
+    def stop(self, wait: bool = True):
+        """Stops the background layout and, if `wait`, waits for the worker to exit."""
+        self.__stop.set()
+        thread = self.__thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    @property
+    def running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def layout(self) -> ForceLayout:
+        return self.__layout
+
+    @property
+    def frames(self) -> int:
+        return self.__frames
+
+    def positions(self) -> Dict[Hashable, Tuple[float, float]]:
+        return {
+            key: (float(x), float(y))
+            for key, (x, y) in zip(self.__keys, self.__layout.positions)
+        }
+
+    def __apply_positions(self):
+        pos = np.round(self.__layout.positions, 1).tolist()
+        for circle, (x, y) in zip(self.__circles, pos):
+            circle.x = x
+            circle.y = y
+        for line, (a, b) in zip(self.__lines, self.__pairs):
+            line.x1, line.y1 = pos[a]
+            line.x2, line.y2 = pos[b]
+
+    def __push_frame(self):
+        self.__apply_positions()
+        if self.page is not None:
+            self.update()
+            self.__frames += 1
+
+    def __run(self, stop: threading.Event):
+        layout = self.__layout
+        frame_interval = 1.0 / self.max_fps if self.max_fps else 0.0
+        last_frame = 0.0
+        converged = False
+        while not stop.is_set() and layout.iterations < self.max_iterations:
+            if layout.step() < self.tolerance * layout.k:
+                converged = True
+                break
+            now = time.perf_counter()
+            if now - last_frame >= frame_interval and not stop.is_set():
+                self.__push_frame()
+                last_frame = now
+        if stop.is_set():
+            # stopped or unmounting: nothing more to send
+            return
+        self.__push_frame()
+
+        if self.on_layout_end is not None and self.page is not None:
+            self.on_layout_end(
+                GraphLayoutEndEvent(self, layout.iterations, layout.energy, converged)
+            )
+
+
+class GraphLayoutEndEvent(ControlEvent):
+    def __init__(self, control: GraphView, iterations: int, energy: float, converged: bool):
+        super().__init__(
+            control.uid,
+            "layout_end",
+            json.dumps({"iterations": iterations, "energy": energy, "converged": converged}),
+            control,
+            control.page,
+        )
+        self.iterations: int = iterations
+        self.energy: float = energy
+        self.converged: bool = converged
@@ -0,0 +1,225 @@
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, List, Optional, Sequence, Set, Tuple
+
+from flet.core.canvas.shape import Shape
+
+# Ops are plain tuples to keep the log small:
+#   ("a", shapes, indices)                 shapes were inserted at indices
+#   ("r", shapes, indices)                 shapes were removed from indices
+#   ("m", shape, names, old, new)          properties of shape were changed
+_OP_COST = 64
+_REF_COST = 8
+
+
+class _Transaction:
+    __slots__ = ("label", "ops", "cost", "time")
+
+    def __init__(self, label: Optional[str], ops: List[tuple], cost: int):
+        self.label = label
+        self.ops = ops
+        self.cost = cost
+        self.time = time.monotonic()
+
+    @property
+    def is_modify_only(self) -> bool:
+        return all(op[0] == "m" for op in self.ops)
+
+    def modify_key(self) -> Tuple:
+        return tuple((id(op[1]), op[2]) for op in self.ops)
+
+
+class EditTransaction:
+    """
+    Collects shape edits made on a Drawboard inside `with drawboard.edit():`.
+
+    Edits are applied immediately; on exit the transaction is recorded in the
+    board's EditHistory and only the affected shapes are sent to the client.
+    """
+
+    def __init__(self, history: "EditHistory", label: Optional[str] = None):
+        self.__history = history
+        self.__label = label
+        self.__ops: List[tuple] = []
+
+    def add(self, *shapes: Shape, at: Optional[int] = None):
+        board = self.__history.shapes
+        start = len(board) if at is None else at
+        indices = tuple(range(start, start + len(shapes)))
+        board[start:start] = shapes
+        self.__ops.append(("a", shapes, indices))
+
+    def remove(self, *shapes: Shape):
+        board = self.__history.shapes
+        targets = {id(s) for s in shapes}
+        indices = tuple(i for i, s in enumerate(board) if id(s) in targets)
+        removed = tuple(board[i] for i in indices)
+        board[:] = [s for s in board if id(s) not in targets]
+        self.__ops.append(("r", removed, indices))
+
+    def modify(self, shape: Shape, **props: Any):
+        names = tuple(props)
+        old = tuple(getattr(shape, name) for name in names)
+        for name, value in props.items():
+            setattr(shape, name, value)
+        self.__ops.append(("m", shape, names, old, tuple(props.values())))
+
+    def __enter__(self) -> "EditTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            # roll back whatever was applied before the error
+            self.__history._apply(self.__ops, undo=True, emit=False)
+            return False
+        if self.__ops:
+            self.__history._record(self.__label, self.__ops)
+        return False
+
+
+class EditHistory:
+    """
+    Undo/redo log of inverse edit commands for a Drawboard.
+
+    Each transaction stores only the shapes and property values it touched.
+    The log is trimmed from the oldest end once its estimated size exceeds
+    `memory_budget` bytes, and consecutive property-only transactions on the
+    same shapes and properties that arrive within `coalesce_interval` seconds
+    are merged into one undo step.
+    """
+
+    def __init__(self, drawboard, memory_budget: int = 8 * 1024 * 1024, coalesce_interval: float = 0.5):
+        self.drawboard = drawboard
+        self.memory_budget = memory_budget
+        self.coalesce_interval = coalesce_interval
+        self.__lock = threading.RLock()
+        self.__undo: Deque[_Transaction] = deque()
+        self.__redo: Deque[_Transaction] = deque()
+        self.__cost = 0
+        self.evicted = 0
+
+    @property
+    def shapes(self) -> List[Shape]:
+        return self.drawboard.shapes
+
+    @property
+    def can_undo(self) -> bool:
+        return len(self.__undo) > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return len(self.__redo) > 0
+
+    @property
+    def size(self) -> int:
+        """Estimated memory held by the log, in bytes."""
+        return self.__cost
+
+    def clear(self):
+        with self.__lock:
+            self.__undo.clear()
+            self.__redo.clear()
+            self.__cost = 0
+
+    def undo(self) -> bool:
+        with self.__lock:
+            if not self.__undo:
+                return False
+            tx = self.__undo.pop()
+            self.__redo.append(tx)
+            self._apply(tx.ops, undo=True)
+            return True
+
+    def redo(self) -> bool:
+        with self.__lock:
+            if not self.__redo:
+                return False
+            tx = self.__redo.pop()
+            self.__undo.append(tx)
+            self._apply(tx.ops, undo=False)
+            return True
+
+    def _record(self, label: Optional[str], ops: List[tuple]):
+        with self.__lock:
+            for tx in self.__redo:
+                self.__cost -= tx.cost
+            self.__redo.clear()
+
+            tx = _Transaction(label, ops, sum(_op_cost(op) for op in ops))
+            last = self.__undo[-1] if self.__undo else None
+            if (
+                last is not None
+                and tx.is_modify_only
+                and last.is_modify_only
+                and tx.time - last.time <= self.coalesce_interval
+                and tx.modify_key() == last.modify_key()
+            ):
+                # keep the oldest "before" values and the newest "after" values
+                last.ops = [
+                    (op[0], op[1], op[2], prev[3], op[4]) for prev, op in zip(last.ops, ops)
+                ]
+                last.time = tx.time
+                self._emit(ops)
+                return
+
+            self.__undo.append(tx)
+            self.__cost += tx.cost
+            while self.__cost > self.memory_budget and len(self.__undo) > 1:
+                self.__cost -= self.__undo.popleft().cost
+                self.evicted += 1
+            self._emit(ops)
+
+    def _apply(self, ops: List[tuple], undo: bool, emit: bool = True):
+        board = self.shapes
+        for op in reversed(ops) if undo else ops:
+            kind = op[0]
+            if kind == "m":
+                _, shape, names, old, new = op
+                for name, value in zip(names, old if undo else new):
+                    setattr(shape, name, value)
+            elif (kind == "a") == undo:
+                targets = {id(s) for s in op[1]}
+                board[:] = [s for s in board if id(s) not in targets]
+            else:
+                for shape, index in zip(op[1], op[2]):
+                    board.insert(index, shape)
+        if emit:
+            self._emit(ops)
+
+    def _emit(self, ops: Sequence[tuple]):
+        drawboard = self.drawboard
+        page = drawboard.page
+        if page is None:
+            return
+        if any(op[0] != "m" for op in ops):
+            drawboard.update()
+            return
+        on_board = {id(s) for s in self.shapes}
+        touched: Set[int] = set()
+        shapes = []
+        for op in ops:
+            shape = op[1]
+            if id(shape) in on_board and id(shape) not in touched:
+                touched.add(id(shape))
+                shapes.append(shape)
+        if shapes:
+            page.update(*shapes)
+
+
+def _op_cost(op: tuple) -> int:
+    if op[0] == "m":
+        return _OP_COST + sum(sys.getsizeof(v) for v in (*op[3], *op[4]))
+    cost = _OP_COST + _REF_COST * (len(op[1]) + len(op[2]))
+    if op[0] == "r":
+        # removed shapes are only kept alive by the log
+        cost += sum(_shape_cost(s) for s in op[1])
+    return cost
+
+
+def _shape_cost(shape: Shape) -> int:
+    state = vars(shape)
+    return sys.getsizeof(shape) + sys.getsizeof(state) + sum(
+        sys.getsizeof(v) for v in state.values()
+    )
@@ -0,0 +1,244 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+from flet.core.control_event import ControlEvent
+from flet.core.image import Image
+
+from xilowidgets.mediaquery import MediaQuery
+
+# physical widths variants are generated at; the picker only re-picks when the
+# required width moves to another step of this ladder
+DEFAULT_WIDTHS = (320, 480, 640, 960, 1280, 1920, 2560, 3840)
+
+
+@dataclass
+class ImageVariant:
+    """One entry of a srcset-like list: an image source and its width in physical pixels."""
+
+    src: str
+    width: int
+
+
+class ImageVariantCache:
+    """
+    On-disk cache of downscaled copies of local images.
+
+    Files are named after the source path, its modification time and the
+    target width, so a changed source never hits a stale variant. Once the
+    cache holds more than `max_bytes` the least recently used files are
+    deleted, skipping files still in use: every `get()` holds the returned
+    file until a matching `release()`. `resize(source, target, width)` may be
+    replaced to use another imaging library; the default needs Pillow.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        max_bytes: int = 256 * 1024 * 1024,
+        resize: Optional[Callable[[str, str, int], None]] = None,
+    ):
+        if resize is None and PILImage is None:
+            raise ImportError(
+                "ImageVariantCache requires Pillow, install it with `pip install xilowidgets[image]`"
+            )
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.resize = resize or _pil_resize
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.__lock = threading.Lock()
+        self.__files: "OrderedDict[str, int]" = OrderedDict()
+        self.__refs: Dict[str, int] = {}
+        self.__size = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self.__scan()
+
+    @property
+    def size(self) -> int:
+        """Bytes currently held on disk."""
+        return self.__size
+
+    def get(self, source: str, width: int) -> str:
+        """
+        Returns the path of `source` scaled down to `width` pixels, generating
+        it if needed. The file is not evicted until `release(path)` is called.
+        """
+        st = os.stat(source)
+        key = hashlib.sha1(f"{os.path.abspath(source)}:{st.st_mtime_ns}:{width}".encode()).hexdigest()
+        name = f"{key}{os.path.splitext(source)[1].lower()}"
+        path = os.path.join(self.directory, name)
+
+        with self.__lock:
+            if name in self.__files and os.path.exists(path):
+                self.hits += 1
+                self.__files.move_to_end(name)
+                self.__refs[name] = self.__refs.get(name, 0) + 1
+                return path
+            self.misses += 1
+
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        self.resize(source, tmp_path, width)
+        os.replace(tmp_path, path)
+
+        with self.__lock:
+            self.__size -= self.__files.pop(name, 0)
+            self.__files[name] = os.path.getsize(path)
+            self.__size += self.__files[name]
+            self.__refs[name] = self.__refs.get(name, 0) + 1
+            self.__evict()
+        return path
+
+    def release(self, path: str):
+        """Gives up one `get()` of `path`; unused files become evictable again."""
+        name = os.path.basename(path)
+        with self.__lock:
+            refs = self.__refs.get(name, 0) - 1
+            if refs > 0:
+                self.__refs[name] = refs
+            else:
+                self.__refs.pop(name, None)
+            self.__evict()
+
+    def __evict(self):
+        if self.__size <= self.max_bytes:
+            return
+        # files shown by an image stay, even if that keeps the cache over budget
+        for old in [n for n in self.__files if n not in self.__refs]:
+            if self.__size <= self.max_bytes:
+                break
+            self.__size -= self.__files.pop(old)
+            self.evicted += 1
+            try:
+                os.remove(os.path.join(self.directory, old))
+            except OSError:
+                pass
+
+    def __scan(self):
+        # rebuild the LRU order of a previous run from access times
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                st = entry.stat()
+                entries.append((st.st_atime, entry.name, st.st_size))
+        for _, name, size in sorted(entries):
+            self.__files[name] = size
+            self.__size += size
+
+
+class ImageSourcePicker:
+    """
+    Keeps the `src` of an `ft.Image` at the smallest adequate resolution.
+
+    The required width is the window width from `media_query` times
+    `fraction`, multiplied by the device pixel ratio and rounded up to the
+    next step of `widths`. The smallest of `variants` that is at least that
+    wide is used; if there is none and `source` is a local file, a variant is
+    generated through `cache`. Beyond the biggest step the smallest variant
+    that is wide enough is used, or `source` if none is. Nothing is re-picked
+    while the step stays the same.
+    """
+
+    def __init__(
+        self,
+        image: Image,
+        media_query: MediaQuery,
+        source: str,
+        variants: Optional[Sequence[ImageVariant]] = None,
+        cache: Optional[ImageVariantCache] = None,
+        cache_url: Optional[str] = None,
+        fraction: float = 1.0,
+        widths: Sequence[int] = DEFAULT_WIDTHS,
+    ):
+        self.image = image
+        self.media_query = media_query
+        self.source = source
+        self.variants = sorted(variants or [], key=lambda v: v.width)
+        self.cache = cache
+        self.cache_url = cache_url
+        self.fraction = fraction
+        self.widths = tuple(sorted(widths))
+        self.__width_class: Optional[int] = None
+        # cache file currently shown, held until another src is picked
+        self.__cached: Optional[str] = None
+        self.__unsubscribe: Tuple[Callable[[], None], ...] = ()
+
+    @property
+    def width_class(self) -> Optional[int]:
+        """Physical width the current `src` was picked for."""
+        return self.__width_class
+
+    def attach(self):
+        """Picks a source now and again whenever the window size or pixel ratio changes."""
+        if not self.__unsubscribe:
+            self.__unsubscribe = (
+                self.media_query.subscribe("size_change", self.__on_change),
+                self.media_query.subscribe("metrics_change", self.__on_change),
+            )
+        self.pick()
+
+    def detach(self):
+        for unsubscribe in self.__unsubscribe:
+            unsubscribe()
+        self.__unsubscribe = ()
+
+    def pick(self) -> bool:
+        """Updates `image.src` if the required width class changed; returns True if it did."""
+        size = self.media_query.size
+        if size is None:
+            return False
+        metrics = self.media_query.metrics
+        dpr = metrics.device_pixel_ratio if metrics is not None else 1.0
+        needed = size[0] * self.fraction * dpr
+        width_class = next((w for w in self.widths if w >= needed), None)
+        if width_class is None:
+            # beyond the biggest step, a registered variant may still be wide enough
+            width_class = next((v.width for v in self.variants if v.width >= needed), None)
+        if width_class == self.__width_class and self.__width_class is not None:
+            return False
+        self.__width_class = width_class
+
+        src, cached = self.__select(width_class)
+        previous, self.__cached = self.__cached, cached
+        if previous is not None:
+            self.cache.release(previous)
+        if src == self.image.src:
+            return False
+        self.image.src = src
+        if self.image.page is not None:
+            self.image.update()
+        return True
+
+    def __select(self, width: Optional[int]) -> Tuple[str, Optional[str]]:
+        # returns the src and the cache file it refers to, if any
+        if width is None:
+            # nothing narrower than the full resolution is adequate
+            return self.source, None
+        for variant in self.variants:
+            if variant.width >= width:
+                return variant.src, None
+        if self.cache is None or not os.path.isfile(self.source):
+            return self.source, None
+        path = self.cache.get(self.source, width)
+        if self.cache_url is None:
+            return path, path
+        return f"{self.cache_url.rstrip('/')}/{os.path.basename(path)}", path
+
+    def __on_change(self, e: ControlEvent):
+        self.pick()
+
+
+def _pil_resize(source: str, target: str, width: int):
+    with PILImage.open(source) as img:
+        if img.width > width:
+            img = img.resize((width, max(1, round(img.height * width / img.width))), PILImage.LANCZOS)
+        img.save(target, format=PILImage.registered_extensions().get(os.path.splitext(source)[1].lower()))
@@ -1,21 +1,115 @@
+import asyncio
 import json
-from typing import Any, Optional
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from flet.core.constrained_control import ConstrainedControl
 from flet.core.control import OptionalNumber
+from flet.core.padding import Padding
 from flet.core.types import ColorEnums, ColorValue, OptionalEventCallable, ControlEvent, ThemeMode
-from flet.core.event_handler import EventHandler
+
+
+@dataclass
+class MediaQueryBreakpoint:
+    name: str
+    min_width: float = 0
+
+
+@dataclass
+class MediaQueryRatePolicy:
+    """
+    Limits how often `size_change` is delivered. Times are in milliseconds.
+
+    `debounce` waits for that long without changes, `throttle` spaces deliveries
+    at least that far apart and `leading` delivers the first change of a burst
+    right away. The last size of a burst is always delivered.
+    """
+
+    debounce: OptionalNumber = None
+    throttle: OptionalNumber = None
+    leading: bool = False
+
+
+@dataclass
+class MediaQueryMetrics:
+    """Environment metrics of the client view, merged from `metrics_change` deltas."""
+
+    device_pixel_ratio: float = 1.0
+    text_scale_factor: float = 1.0
+    padding: Padding = field(default_factory=lambda: Padding(0, 0, 0, 0))
+    view_insets: Padding = field(default_factory=lambda: Padding(0, 0, 0, 0))
+
+
+class _RateLimiter:
+    """
+    Server-side safety net for a client that ignores `sizeChangePolicy`.
+
+    The client already debounced and throttled, so the policy is not applied
+    again here: a compliant client never reports sizes closer together than
+    its debounce or throttle interval, and those pass straight through. Only
+    faster reports are held back, keeping the latest, until the interval has
+    passed since the previous delivery.
+    """
+
+    def __init__(self, policy: MediaQueryRatePolicy, deliver: Callable[[Any], None]):
+        self.interval = max(policy.debounce or 0, policy.throttle or 0) / 1000
+        self.deliver = deliver
+        self.suppressed = 0
+        self.__lock = threading.Lock()
+        self.__pending = None
+        self.__timer: Optional[threading.Timer] = None
+        self.__last = -float("inf")
+
+    def submit(self, item):
+        with self.__lock:
+            now = time.monotonic()
+            if self.__timer is None and now - self.__last >= self.interval:
+                self.__last = now
+            else:
+                if self.__pending is not None:
+                    self.suppressed += 1
+                self.__pending = item
+                if self.__timer is None:
+                    self.__timer = threading.Timer(self.__last + self.interval - now, self.__flush)
+                    self.__timer.daemon = True
+                    self.__timer.start()
+                return
+        self.deliver(item)
+
+    def __flush(self):
+        with self.__lock:
+            self.__timer = None
+            item, self.__pending = self.__pending, None
+            self.__last = time.monotonic()
+        self.deliver(item)
 
 
 class MediaQuery(ConstrainedControl):
     """
     MediaQuery Control.
+
+    The last reported `size`, `theme_mode`, `breakpoint` and `metrics` are cached
+    on the control. Every payload is parsed once into its typed event, which is then
+    passed to the `on_*` handler, to all `subscribe()`d listeners and to pending
+    `wait_for_change()` calls.
+
+    The client only reports the kinds of events that are used: those with an
+    `on_*` handler or a `subscribe()`d listener, `breakpoint_change` while
+    `breakpoints` are set, and those listed in `cached_events` to keep the
+    cached state current without a handler.
     """
 
     def __init__(
         self,
         on_size_change: OptionalEventCallable["MediaQuerySizeChangeEvent"] = None,
         on_theme_mode_change: OptionalEventCallable["MediaQueryThemeModeChangeEvent"] = None,
+        breakpoints: Optional[List[MediaQueryBreakpoint]] = None,
+        on_breakpoint_change: OptionalEventCallable["MediaQueryBreakpointChangeEvent"] = None,
+        size_change_policy: Optional[MediaQueryRatePolicy] = None,
+        on_metrics_change: OptionalEventCallable["MediaQueryMetricsChangeEvent"] = None,
+        cached_events: Optional[List[str]] = None,
         #
         # Control
         #
@@ -43,36 +137,218 @@ class MediaQuery(ConstrainedControl):
             bottom=bottom,
         )
 
-        self.__on_size_change = EventHandler(lambda e: MediaQuerySizeChangeEvent(e))
-        self._add_event_handler("size_change", self.__on_size_change.get_handler())
+        self.__size: Optional[Tuple[float, float]] = None
+        self.__theme_mode: Optional[ThemeMode] = None
+        self.__breakpoint: Optional[str] = None
+        self.__metrics: Optional[MediaQueryMetrics] = None
+        self.__client_suppressed = 0
+        self.__handlers: Dict[str, Optional[Callable]] = {}
+        self.__listeners: Dict[str, List[Callable]] = {name: [] for name in _EVENTS}
+        self.__waiters: List[Tuple[asyncio.Future, Optional[Callable[[ControlEvent], bool]]]] = []
 
-        self.__on_theme_mode_change = EventHandler(lambda e: MediaQueryThemeModeChangeEvent(e))
-        self._add_event_handler("theme_mode_change", self.__on_theme_mode_change.get_handler())
+        for name in _EVENTS:
+            self._add_event_handler(name, self.__handle_event)
 
         self.on_size_change = on_size_change
         self.on_theme_mode_change = on_theme_mode_change
+        self.breakpoints = breakpoints
+        self.on_breakpoint_change = on_breakpoint_change
+        self.size_change_policy = size_change_policy
+        self.on_metrics_change = on_metrics_change
+        self.cached_events = cached_events
 
     def _get_control_name(self):
         return "mediaquery"
 
+    def before_update(self):
+        super().before_update()
+        self._set_attr_json("breakpoints", self.__breakpoints)
+        self._set_attr_json("sizeChangePolicy", self.__size_change_policy)
+        for name, attr in _EVENT_ATTRS.items():
+            self._set_attr(attr, True if self.__wants(name) else None)
+
+    def __wants(self, name: str) -> bool:
+        return (
+            self.__handlers.get(name) is not None
+            or len(self.__listeners[name]) > 0
+            or name in self.__cached_events
+            or (name == "breakpoint_change" and bool(self.__breakpoints))
+        )
+
+    def __sync_event(self, name: str):
+        # a subscription made while mounted has to reach the client right away
+        enabled = self._get_attr(_EVENT_ATTRS[name], data_type="bool", def_value=False)
+        if enabled != self.__wants(name) and self.page is not None:
+            self.update()
+
+    async def __handle_event(self, e: ControlEvent):
+        event = _EVENTS[e.name](e)
+        if isinstance(event, MediaQuerySizeChangeEvent):
+            self.__size = (event.window_width, event.window_height)
+            self.__client_suppressed += json.loads(e.data).get("suppressed", 0)
+            if self.__size_limiter is not None:
+                # server-side safety net for clients that do not limit themselves
+                self.__size_limiter.submit(event)
+                return
+        elif isinstance(event, MediaQueryThemeModeChangeEvent):
+            self.__theme_mode = event.theme_mode
+        elif isinstance(event, MediaQueryMetricsChangeEvent):
+            self.__metrics = event.metrics = replace(self.__metrics or MediaQueryMetrics(), **event.changes)
+        else:
+            self.__breakpoint = event.breakpoint
+        await self.__dispatch(event)
+
+    async def __dispatch(self, event: ControlEvent):
+        handler = self.__handlers.get(event.name)
+        for callback in ([handler] if handler is not None else []) + self.__listeners[event.name]:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(event)
+            else:
+                event.page.run_thread(callback, event)
+
+        waiters, self.__waiters = self.__waiters, []
+        for future, predicate in waiters:
+            if future.done():
+                continue
+            if predicate is None or predicate(event):
+                future.set_result(event)
+            else:
+                self.__waiters.append((future, predicate))
+
+    # cached state
+    @property
+    def size(self) -> Optional[Tuple[float, float]]:
+        """Last reported `(width, height)` of the window, or `None` before the first report."""
+        return self.__size
+
+    @property
+    def theme_mode(self) -> Optional[ThemeMode]:
+        return self.__theme_mode
+
+    @property
+    def breakpoint(self) -> Optional[str]:
+        """Name of the active breakpoint, or `None` if `breakpoints` are not set."""
+        return self.__breakpoint
+
+    @property
+    def metrics(self) -> Optional[MediaQueryMetrics]:
+        """Last known pixel ratio, text scale, safe-area padding and view insets."""
+        return self.__metrics
+
+    def subscribe(self, event_name: str, listener: Callable[[ControlEvent], Any]) -> Callable[[], None]:
+        """
+        Adds a listener for `"size_change"`, `"theme_mode_change"`, `"breakpoint_change"`
+        or `"metrics_change"` and returns a function that removes it again.
+        """
+        if event_name not in _EVENTS:
+            raise ValueError(f"Unknown MediaQuery event: {event_name}")
+        self.__listeners[event_name].append(listener)
+        self.__sync_event(event_name)
+
+        def unsubscribe():
+            if listener in self.__listeners[event_name]:
+                self.__listeners[event_name].remove(listener)
+                self.__sync_event(event_name)
+
+        return unsubscribe
+
+    async def wait_for_change(
+        self,
+        predicate: Optional[Callable[[ControlEvent], bool]] = None,
+        timeout: OptionalNumber = None,
+    ) -> ControlEvent:
+        """
+        Waits for the next size, theme mode, breakpoint or metrics event accepted by `predicate`
+        and returns it, e.g. `await mq.wait_for_change(lambda e: mq.breakpoint == "desktop")`.
+        Only kinds of events the client reports are seen, see the class description.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.__waiters.append((future, predicate))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.__waiters = [w for w in self.__waiters if w[0] is not future]
+
+    # size_change_policy
+    @property
+    def size_change_policy(self) -> Optional[MediaQueryRatePolicy]:
+        return self.__size_change_policy
+
+    @size_change_policy.setter
+    def size_change_policy(self, value: Optional[MediaQueryRatePolicy]):
+        self.__size_change_policy = value
+        self.__size_limiter = (
+            _RateLimiter(value, lambda e: e.page.run_task(self.__dispatch, e))
+            if value is not None
+            else None
+        )
+
+    @property
+    def suppressed_size_changes(self) -> int:
+        """Size changes dropped by the client plus those dropped by the server-side limiter."""
+        return self.__client_suppressed + (
+            self.__size_limiter.suppressed if self.__size_limiter is not None else 0
+        )
+
+    # cached_events
+    @property
+    def cached_events(self) -> List[str]:
+        """Event names, e.g. `["size_change"]`, reported even without handlers to keep `size` etc. current."""
+        return list(self.__cached_events)
+
+    @cached_events.setter
+    def cached_events(self, value: Optional[List[str]]):
+        for name in value or []:
+            if name not in _EVENTS:
+                raise ValueError(f"Unknown MediaQuery event: {name}")
+        self.__cached_events = list(value or [])
+
     # size
     @property
     def on_size_change(self) -> OptionalEventCallable["MediaQuerySizeChangeEvent"]:
-        return self.__on_size_change.handler
+        return self.__handlers.get("size_change")
 
     @on_size_change.setter
     def on_size_change(self, handler: OptionalEventCallable["MediaQuerySizeChangeEvent"]):
-        self.__on_size_change.handler = handler
-        self._set_attr("onSizeChange", True if handler is not None else None)
+        self.__handlers["size_change"] = handler
     
     @property
     def on_theme_mode_change(self) -> OptionalEventCallable["MediaQueryThemeModeChangeEvent"]:
-        return self.__on_theme_mode_change.handler
+        return self.__handlers.get("theme_mode_change")
 
     @on_theme_mode_change.setter
     def on_theme_mode_change(self, handler: OptionalEventCallable["MediaQueryThemeModeChangeEvent"]):
-        self.__on_theme_mode_change.handler = handler
-        self._set_attr("onThemeModeChange", True if handler is not None else None)
+        self.__handlers["theme_mode_change"] = handler
+
+    # breakpoints
+    @property
+    def breakpoints(self) -> Optional[List[MediaQueryBreakpoint]]:
+        """
+        Width classes, e.g. `[MediaQueryBreakpoint("phone"), MediaQueryBreakpoint("tablet", 600)]`.
+        The client picks the last breakpoint whose `min_width` fits the window and only
+        reports `breakpoint_change` when that choice changes.
+        """
+        return self.__breakpoints
+
+    @breakpoints.setter
+    def breakpoints(self, value: Optional[List[MediaQueryBreakpoint]]):
+        self.__breakpoints = value
+
+    @property
+    def on_breakpoint_change(self) -> OptionalEventCallable["MediaQueryBreakpointChangeEvent"]:
+        return self.__handlers.get("breakpoint_change")
+
+    @on_breakpoint_change.setter
+    def on_breakpoint_change(self, handler: OptionalEventCallable["MediaQueryBreakpointChangeEvent"]):
+        self.__handlers["breakpoint_change"] = handler
+
+    @property
+    def on_metrics_change(self) -> OptionalEventCallable["MediaQueryMetricsChangeEvent"]:
+        return self.__handlers.get("metrics_change")
+
+    @on_metrics_change.setter
+    def on_metrics_change(self, handler: OptionalEventCallable["MediaQueryMetricsChangeEvent"]):
+        self.__handlers["metrics_change"] = handler
 
 class MediaQuerySizeChangeEvent(ControlEvent):
     def __init__(self, e: ControlEvent):
@@ -85,4 +361,44 @@ class MediaQueryThemeModeChangeEvent(ControlEvent):
     def __init__(self, e: ControlEvent):
         super().__init__(e.target, e.name, e.data, e.control, e.page)
         d = json.loads(e.data)
-        self.theme_mode: ThemeMode = ThemeMode.DARK if bool(d.get("theme_mode")) else ThemeMode.LIGHT
\ No newline at end of file
+        self.theme_mode: ThemeMode = ThemeMode.DARK if bool(d.get("theme_mode")) else ThemeMode.LIGHT
+
+class MediaQueryBreakpointChangeEvent(ControlEvent):
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        d = json.loads(e.data)
+        self.breakpoint: str = d.get("name")
+        # position in `MediaQuery.breakpoints` as given, not sorted by width
+        self.index: int = d.get("index")
+        self.window_width: float = d.get("width")
+
+class MediaQueryMetricsChangeEvent(ControlEvent):
+    """
+    Carries only the metrics that changed in `changes`; `metrics` is the merged
+    snapshot after applying them.
+    """
+
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        d = json.loads(e.data)
+        self.changes: Dict[str, Any] = {
+            k: Padding(*v) if isinstance(v, list) else v
+            for k, v in d.items()
+            if k in MediaQueryMetrics.__dataclass_fields__
+        }
+        self.metrics: Optional[MediaQueryMetrics] = None
+
+
+_EVENTS = {
+    "size_change": MediaQuerySizeChangeEvent,
+    "theme_mode_change": MediaQueryThemeModeChangeEvent,
+    "breakpoint_change": MediaQueryBreakpointChangeEvent,
+    "metrics_change": MediaQueryMetricsChangeEvent,
+}
+
+_EVENT_ATTRS = {
+    "size_change": "onSizeChange",
+    "theme_mode_change": "onThemeModeChange",
+    "breakpoint_change": "onBreakpointChange",
+    "metrics_change": "onMetricsChange",
+}
@@ -0,0 +1,132 @@
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.control import Control, OptionalNumber
+from flet.core.ref import Ref
+from flet.core.types import ResponsiveNumber
+
+from xilowidgets.mediaquery import MediaQuery, MediaQueryBreakpointChangeEvent
+
+
+class Responsive(ConstrainedControl):
+    """
+    Shows one layout per MediaQuery breakpoint.
+
+    `layouts` maps breakpoint names to factories. A layout is built the first
+    time its breakpoint becomes active and is kept as a child afterwards, so
+    switching back to it only changes the `active` index sent to the client;
+    the subtree is neither rebuilt nor serialized again.
+    """
+
+    def __init__(
+        self,
+        media_query: MediaQuery,
+        layouts: Dict[str, Callable[[], Control]],
+        default: Optional[str] = None,
+        #
+        # ConstrainedControl
+        #
+        ref: Optional[Ref] = None,
+        key: Optional[str] = None,
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        expand: Union[None, bool, int] = None,
+        expand_loose: Optional[bool] = None,
+        col: Optional[ResponsiveNumber] = None,
+        opacity: OptionalNumber = None,
+        visible: Optional[bool] = None,
+        disabled: Optional[bool] = None,
+        data: Any = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            key=key,
+            width=width,
+            height=height,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            expand=expand,
+            expand_loose=expand_loose,
+            col=col,
+            opacity=opacity,
+            visible=visible,
+            disabled=disabled,
+            data=data,
+        )
+
+        self.media_query = media_query
+        self.layouts = layouts
+        self.default = default
+        self.__built: Dict[str, Control] = {}
+        self.__children: List[Control] = []
+        self.__unsubscribe: Optional[Callable[[], None]] = None
+
+    def _get_control_name(self):
+        return "responsive"
+
+    def _get_children(self):
+        return self.__children
+
+    def before_update(self):
+        super().before_update()
+        name = self.current
+        if name is None:
+            return
+        control = self.__built.get(name)
+        if control is None:
+            control = self.__built[name] = self.__layouts[name]()
+            self.__children.append(control)
+        self._set_attr("active", self.__children.index(control))
+
+    def did_mount(self):
+        super().did_mount()
+        self.__unsubscribe = self.media_query.subscribe("breakpoint_change", self.__on_breakpoint_change)
+
+    def will_unmount(self):
+        super().will_unmount()
+        if self.__unsubscribe is not None:
+            self.__unsubscribe()
+            self.__unsubscribe = None
+
+    def __on_breakpoint_change(self, e: MediaQueryBreakpointChangeEvent):
+        if self.page is not None:
+            self.update()
+
+    @property
+    def current(self) -> Optional[str]:
+        """Name of the layout that is shown for the current breakpoint."""
+        name = self.media_query.breakpoint
+        if name in self.__layouts:
+            return name
+        if self.default is not None:
+            return self.default
+        return next(iter(self.__layouts), None)
+
+    @property
+    def built(self) -> Dict[str, Control]:
+        """Layouts built so far, by breakpoint name."""
+        return dict(self.__built)
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drops a cached layout (or all of them) so it is built again the next time it is shown."""
+        names = list(self.__built) if name is None else [name]
+        for n in names:
+            control = self.__built.pop(n, None)
+            if control is not None:
+                self.__children.remove(control)
+
+    # layouts
+    @property
+    def layouts(self) -> Dict[str, Callable[[], Control]]:
+        return self.__layouts
+
+    @layouts.setter
+    def layouts(self, value: Dict[str, Callable[[], Control]]):
+        self.__layouts = dict(value)
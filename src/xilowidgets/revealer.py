@@ -1,4 +1,6 @@
-from typing import Any, List, Optional, Tuple, Union
+import asyncio
+import threading
+from typing import Any, Callable, List, Optional, Tuple, Union
 from enum import Enum
 from flet.core.alignment import Alignment
 from flet.core.badge import BadgeValue
@@ -15,10 +17,12 @@ from flet.core.control import Control, OptionalNumber
 from flet.core.ref import Ref
 from flet.core.theme import Theme
 from flet.core.tooltip import TooltipValue
+from flet.core.control_event import ControlEvent
 from flet.core.types import (
     BorderRadiusValue,
     ClipBehavior,
     MarginValue,
+    OptionalControlEventCallable,
     PaddingValue,
     ResponsiveNumber,
     RotateValue,
@@ -26,7 +30,23 @@ from flet.core.types import (
     ThemeMode,
 )
 
-class Revealer(ConstrainedControl):
+from xilowidgets.attrcache import CachedJsonAttrs
+
+# client default of Revealer.animation_duration, in milliseconds
+_DEFAULT_DURATION = 300
+
+class Revealer(CachedJsonAttrs, ConstrainedControl):
+    """
+    Revealer Control.
+
+    Instead of `content`, a `content_factory` can be given. It is called the
+    first time the content is revealed, so hidden panels cost nothing until
+    they are opened. With `unmount_delay` (milliseconds) set, content built by
+    the factory is dropped again once it has been hidden for that long, but
+    never before the hide animation (`animation_duration`) finished, and is
+    rebuilt on the next reveal.
+    """
+
     class Orientation(Enum):
         VERTICAL: str = "VERTICAL"
         HORIZONTAL: str = "HORIZONTAL"
@@ -53,6 +73,9 @@ class Revealer(ConstrainedControl):
         color_filter: Optional[ColorFilter] = None,
         ignore_interactions: Optional[bool] = None,
         foreground_decoration: Optional[BoxDecoration] = None,
+        content_factory: Optional[Callable[[], Control]] = None,
+        unmount_delay: OptionalNumber = None,
+        on_reveal_end: OptionalControlEventCallable = None,
         #
         # ConstrainedControl and AdaptiveControl
         #
@@ -76,6 +99,7 @@ class Revealer(ConstrainedControl):
         disabled: Optional[bool] = None,
         data: Any = None,
         rtl: Optional[bool] = None,
+        on_animation_end: OptionalControlEventCallable = None,
     ):
         ConstrainedControl.__init__(
             self,
@@ -99,9 +123,17 @@ class Revealer(ConstrainedControl):
             disabled=disabled,
             data=data,
             rtl=rtl,
+            on_animation_end=on_animation_end,
         )
 
+        self.__unmount_timer: Optional[threading.Timer] = None
+        self.__on_reveal_end: OptionalControlEventCallable = None
+        self.__reveal_listeners: List[Callable[["Revealer", Optional[int]], None]] = []
+        self.__reveal_seq = 0
+        self._add_event_handler("reveal_end", self.__handle_reveal_end)
         self.content = content
+        self.content_factory = content_factory
+        self.unmount_delay = unmount_delay
         self.content_hidden = content_hidden
         self.orientation = orientation
         self.animation_duration = animation_duration
@@ -121,6 +153,7 @@ class Revealer(ConstrainedControl):
         self.color_filter = color_filter
         self.ignore_interactions = ignore_interactions
         self.foreground_decoration = foreground_decoration
+        self.on_reveal_end = on_reveal_end
 
     def _get_control_name(self):
         return "revealer"
@@ -141,6 +174,71 @@ class Revealer(ConstrainedControl):
         self._set_attr_json("colorFilter", self.__color_filter)
         self._set_attr_json("foregroundDecoration", self.__foreground_decoration)
 
+        if self.__content_factory is None:
+            return
+        if not self.content_hidden:
+            self.__cancel_unmount()
+            if self.__content is None:
+                self.__content = self.__content_factory()
+        elif (
+            self.__content is not None
+            and self.__unmount_timer is None
+            and self.__unmount_delay is not None
+        ):
+            duration = self.animation_duration
+            delay = max(self.__unmount_delay, _DEFAULT_DURATION if duration is None else duration)
+            self.__unmount_timer = threading.Timer(delay / 1000, self.__unmount)
+            self.__unmount_timer.daemon = True
+            self.__unmount_timer.start()
+
+    def will_unmount(self):
+        super().will_unmount()
+        self.__cancel_unmount()
+
+    def __cancel_unmount(self):
+        if self.__unmount_timer is not None:
+            self.__unmount_timer.cancel()
+            self.__unmount_timer = None
+
+    def __unmount(self):
+        self.__unmount_timer = None
+        if not self.content_hidden or self.__content is None:
+            return
+        self.__content = None
+        if self.page is not None:
+            self.update()
+
+    def __handle_reveal_end(self, e: ControlEvent):
+        # "hidden:3": the sequence number of the change the animation belongs to
+        state, _, seq = (e.data or "").partition(":")
+        e.data = state
+        for listener in list(self.__reveal_listeners):
+            listener(self, int(seq) if seq else None)
+        if asyncio.iscoroutinefunction(self.__on_reveal_end):
+            e.page.run_task(self.__on_reveal_end, e)
+        elif self.__on_reveal_end is not None:
+            self.__on_reveal_end(e)
+
+    def _set_content_hidden(self, value: bool) -> int:
+        """Sets `content_hidden` and returns the sequence number its `reveal_end` will carry."""
+        self.__reveal_seq += 1
+        self._set_attr("revealSeq", self.__reveal_seq)
+        self.content_hidden = value
+        return self.__reveal_seq
+
+    def _add_reveal_listener(self, listener: Callable[["Revealer", Optional[int]], None]):
+        self.__reveal_listeners.append(listener)
+        self.__sync_reveal_end()
+
+    def _remove_reveal_listener(self, listener: Callable[["Revealer", Optional[int]], None]):
+        if listener in self.__reveal_listeners:
+            self.__reveal_listeners.remove(listener)
+        self.__sync_reveal_end()
+
+    def __sync_reveal_end(self):
+        wanted = self.__on_reveal_end is not None or len(self.__reveal_listeners) > 0
+        self._set_attr("onRevealEnd", True if wanted else None)
+
     def _get_children(self):
         children = []
         if self.__content is not None:
@@ -284,6 +382,38 @@ class Revealer(ConstrainedControl):
     def content(self, value: Optional[Control]):
         self.__content = value
 
+    # on_reveal_end
+    @property
+    def on_reveal_end(self) -> OptionalControlEventCallable:
+        return self.__on_reveal_end
+
+    @on_reveal_end.setter
+    def on_reveal_end(self, handler: OptionalControlEventCallable):
+        self.__on_reveal_end = handler
+        self.__sync_reveal_end()
+
+    # content_factory
+    @property
+    def content_factory(self) -> Optional[Callable[[], Control]]:
+        return self.__content_factory
+
+    @content_factory.setter
+    def content_factory(self, value: Optional[Callable[[], Control]]):
+        self.__content_factory = value
+
+    # unmount_delay
+    @property
+    def unmount_delay(self) -> OptionalNumber:
+        return self.__unmount_delay
+
+    @unmount_delay.setter
+    def unmount_delay(self, value: OptionalNumber):
+        self.__unmount_delay = value
+
+    @property
+    def content_mounted(self) -> bool:
+        return self.__content is not None
+
     # shape
     @property
     def shape(self) -> Optional[BoxShape]:
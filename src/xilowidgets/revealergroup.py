@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from xilowidgets.revealer import Revealer
+
+# client default of Revealer.animation_duration, in milliseconds
+_DEFAULT_DURATION = 300
+# extra time allowed for reveal_end events before a transition gives up
+_GRACE = 1.0
+
+
+class RevealerTransition:
+    """
+    Completion of one bulk change made through a RevealerGroup.
+
+    Resolves once every changed Revealer reported the end of its animation,
+    or after the longest animation plus a grace period if some never do
+    (e.g. because they are not mounted). Can be awaited or waited on from a
+    thread with `wait()`.
+
+    Each Revealer is expected to report the change with the sequence number it
+    got from this transition, so the end of an older animation cannot complete
+    a newer transition.
+    """
+
+    def __init__(self, revealers: Dict[Revealer, int], timeout: float):
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.__lock = threading.Lock()
+        self.__pending = {id(r): (r, seq) for r, seq in revealers.items()}
+        self.__done = threading.Event()
+        if not self.__pending:
+            self.__done.set()
+
+    @property
+    def pending(self) -> List[Revealer]:
+        with self.__lock:
+            return [r for r, _ in self.__pending.values()]
+
+    def done(self) -> bool:
+        return self.__done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the animations finished; returns False if it gave up waiting."""
+        return self.__done.wait(self.timeout if timeout is None else timeout)
+
+    def __await__(self):
+        return asyncio.get_running_loop().run_in_executor(None, self.wait).__await__()
+
+    def _expired(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+    def _finish(self, revealer: Revealer, seq: Optional[int]) -> bool:
+        with self.__lock:
+            entry = self.__pending.get(id(revealer))
+            if entry is not None and entry[1] == seq:
+                del self.__pending[id(revealer)]
+            if not self.__pending:
+                self.__done.set()
+            return self.__done.is_set()
+
+
+class RevealerGroup:
+    """
+    Reveals and hides a set of Revealers together.
+
+    Every bulk change sets `content_hidden` on the affected members and sends
+    them in a single `page.update()` per page, so each client receives one
+    message and starts all animations in the same frame. Each change returns a
+    `RevealerTransition` that completes when all of its animations ended.
+
+    With `Policy.ACCORDION` at most one member is revealed at a time; with
+    `Policy.EXCLUSIVE` exactly one is, once one has been revealed.
+    """
+
+    class Policy(Enum):
+        INDEPENDENT = "independent"
+        ACCORDION = "accordion"
+        EXCLUSIVE = "exclusive"
+
+    def __init__(
+        self,
+        revealers: Optional[Iterable[Revealer]] = None,
+        policy: Policy = Policy.INDEPENDENT,
+    ):
+        self.policy = policy
+        self.__lock = threading.RLock()
+        self.__members: List[Revealer] = []
+        self.__transitions: List[RevealerTransition] = []
+        if revealers:
+            self.add(*revealers)
+
+    @property
+    def members(self) -> List[Revealer]:
+        return list(self.__members)
+
+    @property
+    def revealed(self) -> List[Revealer]:
+        return [r for r in self.__members if not r.content_hidden]
+
+    def add(self, *revealers: Revealer):
+        with self.__lock:
+            for r in revealers:
+                if r not in self.__members:
+                    self.__members.append(r)
+                    r._add_reveal_listener(self.__on_reveal_end)
+
+    def remove(self, *revealers: Revealer):
+        with self.__lock:
+            for r in revealers:
+                if r in self.__members:
+                    self.__members.remove(r)
+                    r._remove_reveal_listener(self.__on_reveal_end)
+
+    def reveal(self, revealer: Revealer) -> RevealerTransition:
+        changes = {revealer: True}
+        if self.policy != RevealerGroup.Policy.INDEPENDENT:
+            changes.update({r: False for r in self.__members if r is not revealer})
+        return self.apply(changes)
+
+    def hide(self, revealer: Revealer) -> RevealerTransition:
+        if self.policy == RevealerGroup.Policy.EXCLUSIVE:
+            # the last revealed member stays open
+            return self.apply({})
+        return self.apply({revealer: False})
+
+    def toggle(self, revealer: Revealer) -> RevealerTransition:
+        return self.hide(revealer) if not revealer.content_hidden else self.reveal(revealer)
+
+    def reveal_all(self) -> RevealerTransition:
+        assert (
+            self.policy == RevealerGroup.Policy.INDEPENDENT
+        ), "reveal_all() is only supported with Policy.INDEPENDENT"
+        return self.apply({r: True for r in self.__members})
+
+    def hide_all(self) -> RevealerTransition:
+        assert (
+            self.policy != RevealerGroup.Policy.EXCLUSIVE
+        ), "hide_all() is not supported with Policy.EXCLUSIVE"
+        return self.apply({r: False for r in self.__members})
+
+    def apply(self, changes: Dict[Revealer, bool]) -> RevealerTransition:
+        """Reveals (True) or hides (False) members as one batched update."""
+        with self.__lock:
+            changed = {}
+            for r, revealed in changes.items():
+                assert r in self.__members, "Revealer is not a member of this group"
+                if r.content_hidden == revealed:
+                    changed[r] = r._set_content_hidden(not revealed)
+
+            mounted = [r for r in changed if r.page is not None]
+            duration = max(
+                (r.animation_duration or _DEFAULT_DURATION for r in mounted), default=0
+            )
+            transition = RevealerTransition(
+                {r: changed[r] for r in mounted}, duration / 1000 + _GRACE
+            )
+            # transitions that gave up waiting are dropped here as well
+            self.__transitions = [t for t in self.__transitions if not t._expired()]
+            if not transition.done():
+                self.__transitions.append(transition)
+        # one update per page (session) the changed members are mounted on
+        by_page: Dict[int, List[Revealer]] = {}
+        for r in mounted:
+            by_page.setdefault(id(r.page), []).append(r)
+        for revealers in by_page.values():
+            revealers[0].page.update(*revealers)
+        return transition
+
+    def __on_reveal_end(self, revealer: Revealer, seq: Optional[int]):
+        with self.__lock:
+            self.__transitions = [
+                t for t in self.__transitions if not t._finish(revealer, seq) and not t._expired()
+            ]
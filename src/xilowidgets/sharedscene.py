@@ -0,0 +1,202 @@
+import json
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flet.core.canvas.shape import Shape
+from flet.core.control import Control
+
+logger = logging.getLogger("xilowidgets")
+
+
+class SharedScene:
+    """
+    A set of canvas shapes displayed by many Drawboards, usually across sessions.
+
+    The scene keeps one encoded copy of every shape. Each mutation is turned into
+    a patch that is serialized once and queued to every subscribed Drawboard;
+    each subscriber is drained by its own worker, so a slow session only delays
+    itself. When a subscriber falls `max_pending` patches behind its queue is
+    dropped and it is sent a full snapshot of the scene instead.
+    """
+
+    def __init__(self, shapes: Optional[Sequence[Shape]] = None, max_pending: int = 32):
+        self.max_pending = max_pending
+        self.__lock = threading.RLock()
+        self.__ids: Dict[Shape, int] = {}
+        self.__records: Dict[int, Tuple[str, Dict[str, str]]] = {}
+        self.__next_id = 0
+        self.__version = 0
+        self.__snapshot: Optional[Tuple[int, str]] = None
+        self.__subscribers: Dict[Control, "_Subscriber"] = {}
+        if shapes:
+            self.add(*shapes)
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    @property
+    def shapes(self) -> List[Shape]:
+        with self.__lock:
+            return list(self.__ids)
+
+    def add(self, *shapes: Shape):
+        with self.__lock:
+            ops = []
+            for shape in shapes:
+                if shape in self.__ids:
+                    continue
+                sid = self.__next_id
+                self.__next_id += 1
+                self.__ids[shape] = sid
+                self.__records[sid] = (shape._get_control_name(), _encode(shape))
+                ops.append(["a", sid, *self.__records[sid]])
+            self.__publish(ops)
+
+    def update(self, *shapes: Shape):
+        """Re-encodes the given shapes and publishes only the attributes that changed."""
+        with self.__lock:
+            ops = []
+            for shape in shapes:
+                sid = self.__ids.get(shape)
+                if sid is None:
+                    continue
+                name, old = self.__records[sid]
+                new = _encode(shape)
+                changed = {k: v for k, v in new.items() if old.get(k) != v}
+                # null removes the attribute, so the client falls back to its default
+                changed.update({k: None for k in old if k not in new})
+                if changed:
+                    self.__records[sid] = (name, new)
+                    ops.append(["u", sid, changed])
+            self.__publish(ops)
+
+    def remove(self, *shapes: Shape):
+        with self.__lock:
+            ops = []
+            for shape in shapes:
+                sid = self.__ids.pop(shape, None)
+                if sid is not None:
+                    del self.__records[sid]
+                    ops.append(["r", sid])
+            self.__publish(ops)
+
+    def clear(self):
+        with self.__lock:
+            if self.__ids:
+                self.__ids.clear()
+                self.__records.clear()
+                self.__publish([["c"]])
+
+    def subscribe(self, drawboard: Control):
+        """Starts streaming the scene to a mounted Drawboard, beginning with a snapshot."""
+        with self.__lock:
+            if drawboard not in self.__subscribers:
+                self.__subscribers[drawboard] = _Subscriber(self, drawboard)
+
+    def unsubscribe(self, drawboard: Control):
+        with self.__lock:
+            subscriber = self.__subscribers.pop(drawboard, None)
+        if subscriber is not None:
+            subscriber.close()
+
+    def stats(self) -> List[Dict[str, int]]:
+        with self.__lock:
+            return [s.stats() for s in self.__subscribers.values()]
+
+    def _snapshot(self) -> Tuple[int, str]:
+        with self.__lock:
+            if self.__snapshot is None:
+                ops = [["a", sid, *record] for sid, record in self.__records.items()]
+                self.__snapshot = (
+                    self.__version,
+                    _dumps({"v": self.__version, "reset": True, "ops": ops}),
+                )
+            return self.__snapshot
+
+    def __publish(self, ops: list):
+        if not ops:
+            return
+        self.__version += 1
+        self.__snapshot = None
+        payload = _dumps({"v": self.__version, "ops": ops})
+        for subscriber in self.__subscribers.values():
+            subscriber.push(payload)
+
+
+class _Subscriber:
+    def __init__(self, scene: SharedScene, drawboard: Control):
+        self.scene = scene
+        self.drawboard = drawboard
+        self.queue: deque = deque()
+        self.cond = threading.Condition()
+        self.resync = True
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.resyncs = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def push(self, payload: str):
+        with self.cond:
+            if self.resync:
+                # the pending snapshot will already contain this change
+                return
+            if len(self.queue) >= self.scene.max_pending:
+                self.dropped += len(self.queue)
+                self.queue.clear()
+                self.resync = True
+            else:
+                self.queue.append(payload)
+            self.cond.notify()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.queue.clear()
+            self.cond.notify()
+
+    def stats(self) -> Dict[str, int]:
+        with self.cond:
+            return {
+                "pending": len(self.queue),
+                "sent": self.sent,
+                "dropped": self.dropped,
+                "resyncs": self.resyncs,
+            }
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not (self.closed or self.resync or self.queue):
+                    self.cond.wait()
+                if self.closed:
+                    return
+                if self.resync:
+                    self.resync = False
+                    self.queue.clear()
+                    payload = None
+                else:
+                    payload = self.queue.popleft()
+            if payload is None:
+                payload = self.scene._snapshot()[1]
+                self.resyncs += 1
+            try:
+                self.drawboard.invoke_method("scene", {"patch": payload})
+                self.sent += 1
+            except Exception as ex:
+                logger.warning(f"Unable to send scene patch to {self.drawboard}: {ex}")
+                self.scene.unsubscribe(self.drawboard)
+                return
+
+
+def _encode(shape: Shape) -> Dict[str, str]:
+    # flet keeps a cleared attribute as "", for the scene it is simply absent
+    return {k: v for k, v in shape._build_command(update=False).attrs.items() if v != ""}
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
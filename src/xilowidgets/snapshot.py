@@ -0,0 +1,337 @@
+"""
+Columnar binary snapshots of canvas shapes.
+
+Layout (all integers little-endian, every column 8-byte aligned):
+
+    magic      b"XWSNAP"
+    version    u16
+    length     u32      manifest size in bytes
+    manifest   JSON     column offsets, counts and field names
+    columns    ...
+
+Shapes are grouped by type. Numeric properties become float64 columns (NaN for
+None), everything else is encoded as JSON once per distinct value into a shared
+object table and referenced by u32 index, and `Points.points` is stored as a ragged
+float64 vertex column. A u8 column keeps the original z-order across types.
+
+Style values in the object table are plain JSON; flet dataclasses (paints,
+text styles, path elements, ...) and enums are tagged with their class, and
+only dataclasses and enums defined in `flet` are rebuilt when loading. Tuples
+are tagged too so they do not come back as lists.
+"""
+
+import dataclasses
+import importlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import Any, Dict, List, Sequence, Tuple, Type, Union
+
+from flet.core.canvas.arc import Arc
+from flet.core.canvas.circle import Circle
+from flet.core.canvas.color import Color
+from flet.core.canvas.fill import Fill
+from flet.core.canvas.line import Line
+from flet.core.canvas.oval import Oval
+from flet.core.canvas.path import Path
+from flet.core.canvas.points import Points
+from flet.core.canvas.rect import Rect
+from flet.core.canvas.shadow import Shadow
+from flet.core.canvas.shape import Shape
+from flet.core.canvas.text import Text
+from flet.core.transform import Offset
+
+MAGIC = b"XWSNAP"
+VERSION = 2
+
+_NONE = 0xFFFFFFFF
+_HEADER = struct.Struct("<6sHI")
+
+# control name -> (class, numeric properties, object properties)
+SHAPE_SCHEMAS: Dict[str, Tuple[Type[Shape], Tuple[str, ...], Tuple[str, ...]]] = {
+    "arc": (
+        Arc,
+        ("x", "y", "width", "height", "start_angle", "sweep_angle"),
+        ("use_center", "paint"),
+    ),
+    "circle": (Circle, ("x", "y", "radius"), ("paint",)),
+    "color": (Color, (), ("color", "blend_mode")),
+    "fill": (Fill, (), ("paint",)),
+    "line": (Line, ("x1", "y1", "x2", "y2"), ("paint",)),
+    "oval": (Oval, ("x", "y", "width", "height"), ("paint",)),
+    "path": (Path, (), ("elements", "paint")),
+    "points": (Points, (), ("point_mode", "paint")),
+    "rect": (Rect, ("x", "y", "width", "height"), ("border_radius", "paint")),
+    "shadow": (Shadow, ("elevation",), ("path", "color", "transparent_occluder")),
+    "text": (
+        Text,
+        ("x", "y", "max_width", "rotate"),
+        ("text", "style", "alignment", "text_align", "max_lines", "ellipsis"),
+    ),
+}
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def save_snapshot(path: Union[str, os.PathLike], shapes: Sequence[Shape]) -> None:
+    type_names: List[str] = []
+    type_index: Dict[str, int] = {}
+    groups: Dict[str, List[Shape]] = {}
+    order = array("B")
+
+    for shape in shapes:
+        name = shape._get_control_name()
+        if name not in SHAPE_SCHEMAS:
+            raise SnapshotError(f"Unsupported shape type: {name}")
+        if name == "text" and shape.spans:
+            raise SnapshotError("Text spans are not supported in snapshots")
+        if name not in type_index:
+            type_index[name] = len(type_names)
+            type_names.append(name)
+            groups[name] = []
+        order.append(type_index[name])
+        groups[name].append(shape)
+
+    objects: List[bytes] = []
+    object_ids: Dict[bytes, int] = {}
+
+    def intern(value: Any) -> int:
+        if value is None:
+            return _NONE
+        blob = json.dumps(_encode(value), separators=(",", ":"), sort_keys=True).encode()
+        i = object_ids.get(blob)
+        if i is None:
+            i = object_ids[blob] = len(objects)
+            objects.append(blob)
+        return i
+
+    columns: List[bytes] = []
+    offset = 0
+
+    def add_column(data: Union[array, bytes]) -> Dict[str, int]:
+        nonlocal offset
+        raw = _to_little_endian(data) if isinstance(data, array) else data
+        column = {"offset": offset, "size": len(raw)}
+        columns.append(raw + b"\0" * (-len(raw) % 8))
+        offset += len(raw) + (-len(raw) % 8)
+        return column
+
+    manifest: Dict[str, Any] = {
+        "count": len(order),
+        "types": type_names,
+        "order": add_column(order),
+        "groups": [],
+    }
+
+    for name in type_names:
+        _, numeric, objs = SHAPE_SCHEMAS[name]
+        group = groups[name]
+        entry: Dict[str, Any] = {"type": name, "count": len(group), "numeric": {}, "objects": {}}
+        for field in numeric + ("visible",):
+            entry["numeric"][field] = add_column(
+                array("d", (_to_float(getattr(s, field)) for s in group))
+            )
+        for field in objs:
+            entry["objects"][field] = add_column(array("I", (intern(getattr(s, field)) for s in group)))
+        if name == "points":
+            ends = array("Q")
+            vertices = array("d")
+            for s in group:
+                for p in s.points or []:
+                    x, y = (p.x, p.y) if isinstance(p, Offset) else p
+                    vertices.append(x)
+                    vertices.append(y)
+                ends.append(len(vertices) // 2)
+            entry["vertex_ends"] = add_column(ends)
+            entry["vertices"] = add_column(vertices)
+        manifest["groups"].append(entry)
+
+    object_ends = array("Q")
+    size = 0
+    for blob in objects:
+        size += len(blob)
+        object_ends.append(size)
+    manifest["object_ends"] = add_column(object_ends)
+    manifest["objects"] = add_column(b"".join(objects))
+
+    header = json.dumps(manifest, separators=(",", ":")).encode()
+    header += b" " * (-(len(header) + _HEADER.size) % 8)
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for column in columns:
+                f.write(column)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_snapshot(path: Union[str, os.PathLike]) -> List[Shape]:
+    """
+    Restores shapes written by `save_snapshot`. Columns are read straight from a
+    memory-mapped file; equal style values (paints, text styles, ...) are
+    decoded once and shared by every shape that used them. Nothing but flet
+    dataclasses and enums is instantiated from the file, but a crafted snapshot
+    can still hold arbitrary field values, so treat untrusted files as input.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise SnapshotError(f"{path} is not a Drawboard snapshot")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return _read(view, path)
+            finally:
+                view.release()
+
+
+def _read(view: memoryview, path) -> List[Shape]:
+    magic, version, length = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise SnapshotError(f"{path} is not a Drawboard snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version} in {path}")
+    manifest = json.loads(bytes(view[_HEADER.size : _HEADER.size + length]))
+    base = _HEADER.size + length
+
+    def column(c: Dict[str, int], fmt: str):
+        data = view[base + c["offset"] : base + c["offset"] + c["size"]]
+        if sys.byteorder == "little":
+            return data.cast(fmt)
+        swapped = array(fmt, data)
+        swapped.byteswap()
+        return swapped
+
+    blobs = column(manifest["objects"], "B")
+    object_ends = column(manifest["object_ends"], "Q")
+    cache: Dict[int, Any] = {}
+
+    def resolve(i: int) -> Any:
+        if i == _NONE:
+            return None
+        if i not in cache:
+            start = object_ends[i - 1] if i > 0 else 0
+            cache[i] = _decode(json.loads(bytes(blobs[start : object_ends[i]])))
+        return cache[i]
+
+    restored: List[List[Shape]] = []
+    for entry in manifest["groups"]:
+        cls = SHAPE_SCHEMAS[entry["type"]][0]
+        count = entry["count"]
+        numeric = {f: column(c, "d") for f, c in entry["numeric"].items()}
+        visible = numeric.pop("visible", None)
+        objs = {f: column(c, "I") for f, c in entry["objects"].items()}
+        if "vertices" in entry:
+            ends = column(entry["vertex_ends"], "Q")
+            vertices = column(entry["vertices"], "d")
+
+        shapes = []
+        for i in range(count):
+            kwargs = {f: _from_float(col[i]) for f, col in numeric.items()}
+            kwargs.update({f: resolve(col[i]) for f, col in objs.items()})
+            if visible is not None:
+                kwargs["visible"] = bool(visible[i])
+            if "vertices" in entry:
+                start = ends[i - 1] if i > 0 else 0
+                kwargs["points"] = [
+                    Offset(vertices[2 * j], vertices[2 * j + 1]) for j in range(start, ends[i])
+                ]
+            shapes.append(cls(**kwargs))
+        restored.append(shapes)
+
+    # re-interleave the per-type groups in the original z-order
+    cursors = [0] * len(restored)
+    result = []
+    for t in column(manifest["order"], "B"):
+        result.append(restored[t][cursors[t]])
+        cursors[t] += 1
+    return result
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return {"__enum__": _class_name(value), "value": _encode(value.value)}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__dataclass__": _class_name(value),
+            "fields": {
+                f.name: _encode(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+                if f.init
+            },
+        }
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise SnapshotError(f"Unsupported value in snapshot: {value!r}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__tuple__" in value:
+        return tuple(_decode(v) for v in value["__tuple__"])
+    if "__enum__" in value:
+        cls = _resolve(value["__enum__"])
+        if not (isinstance(cls, type) and issubclass(cls, Enum)):
+            raise SnapshotError(f"{value['__enum__']} is not an enum")
+        return cls(_decode(value["value"]))
+    if "__dataclass__" in value:
+        cls = _resolve(value["__dataclass__"])
+        if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
+            raise SnapshotError(f"{value['__dataclass__']} is not a dataclass")
+        return cls(**{k: _decode(v) for k, v in value["fields"].items()})
+    return {k: _decode(v) for k, v in value.items()}
+
+
+def _class_name(value: Any) -> str:
+    cls = type(value)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve(name: str) -> Any:
+    module, _, qualname = name.partition(":")
+    if module != "flet" and not module.startswith("flet."):
+        raise SnapshotError(f"Refusing to load {name} from a snapshot")
+    try:
+        obj: Any = importlib.import_module(module)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as e:
+        raise SnapshotError(f"Unknown type {name} in snapshot") from e
+    return obj
+
+
+def _to_float(value) -> float:
+    return math.nan if value is None or value == "" else float(value)
+
+
+def _from_float(value: float):
+    return None if math.isnan(value) else value
+
+
+def _to_little_endian(data: array) -> bytes:
+    if sys.byteorder == "little" or data.itemsize == 1:
+        return data.tobytes()
+    swapped = array(data.typecode, data)
+    swapped.byteswap()
+    return swapped.tobytes()
@@ -1,5 +1,8 @@
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from flet.core.constrained_control import ConstrainedControl
 from flet.core.control import OptionalNumber, Control, Ref
@@ -12,9 +15,31 @@ from flet.core.types import (
     ScaleValue,
 )
 
+PageFactory = Callable[[], Control]
+PagePredictor = Callable[[int], Sequence[int]]
+
+
 class Switcher(ConstrainedControl):
     """
     Switcher Control.
+
+    Pages are either given up front as `controls` or as `pages` factories. A
+    factory is called the first time its page is switched to; afterwards the
+    page stays mounted while it is among the `keep_alive` most recently shown
+    off-screen pages and the estimated size of all mounted pages fits in
+    `memory_budget` bytes. Evicted pages are removed from the client and
+    rebuilt if they are shown again.
+
+    With `prefetch` set, the pages likely to be shown next are built in a
+    background pool after every switch, so switching to them only has to send
+    them to the client. `prefetch` is either a distance (`1` prefetches the
+    pages before and after the current one) or a function returning the
+    indices to prefetch for the current index. Prefetches that are no longer
+    predicted are cancelled, or their result is dropped if already running.
+
+    `update()` only walks the subtrees of the current page and of the page
+    that is transitioning out; changes made to other pages are sent once they
+    are switched to, or when they are updated directly.
     """
     class Orientation(Enum):
         VERTICAL: str = "VERTICAL"
@@ -26,6 +51,12 @@ class Switcher(ConstrainedControl):
         orientation: Optional[Orientation] = None,
         animation_duration: OptionalNumber = None,
         animation_curve: Optional[AnimationCurve] = None,
+        pages: Optional[Sequence[PageFactory]] = None,
+        keep_alive: int = 2,
+        memory_budget: Optional[int] = None,
+        prefetch: Union[None, int, PagePredictor] = None,
+        prefetch_workers: int = 2,
+        #
         # Control
         #
         opacity: OptionalNumber = None,
@@ -74,7 +105,20 @@ class Switcher(ConstrainedControl):
             disabled=disabled
         )
 
+        assert controls is None or pages is None, "use either controls or pages, not both"
+        self.__built: "OrderedDict[int, Control]" = OrderedDict()
+        self.__costs: Dict[int, int] = {}
+        self.__current = 0
+        self.__previous: Optional[int] = None
+        self.__wrappers: Dict[int, _SwitcherPage] = {}
+        self.__prefetched: Dict[int, Future] = {}
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.prefetch = prefetch
+        self.prefetch_workers = prefetch_workers
         self.controls = controls
+        self.pages = pages
+        self.keep_alive = keep_alive
+        self.memory_budget = memory_budget
         self.orientation = orientation
         self.animation_duration = animation_duration
         self.animation_curve = animation_curve
@@ -82,11 +126,97 @@ class Switcher(ConstrainedControl):
     def _get_control_name(self):
         return "switcher"
     
+    def before_update(self):
+        super().before_update()
+        self._set_attr("currentIndex", self.__current)
+        if self.__pages is not None:
+            self._set_attr("pageCount", len(self.__pages))
+            if self.__pages:
+                self.__mount(self.__current)
+
+    def did_mount(self):
+        super().did_mount()
+        self.__prefetch()
+
+    def will_unmount(self):
+        super().will_unmount()
+        self.__cancel_prefetch()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
     def _get_children(self):
-        return self.__controls
+        if self.__pages is not None:
+            pages = [(i, self.__built[i]) for i in sorted(self.__built)]
+        else:
+            pages = list(enumerate(self.__controls))
+        # wrappers must keep their identity, the update diff is based on it
+        wrappers = {}
+        for i, control in pages:
+            wrapper = self.__wrappers.get(id(control))
+            if wrapper is None or wrapper.content is not control:
+                wrapper = _SwitcherPage(control)
+            wrapper.index = i
+            wrapper.active = i == self.__current or i == self.__previous
+            wrappers[id(control)] = wrapper
+        self.__wrappers = wrappers
+        return list(wrappers.values())
+
+    def __mount(self, index: int):
+        control = self.__built.get(index)
+        if control is None:
+            future = self.__prefetched.pop(index, None)
+            if future is not None and not future.cancelled():
+                # waits if the prefetch is still running instead of building twice
+                try:
+                    control = future.result()
+                except Exception:
+                    # a failed prefetch is retried here, so errors surface on this page
+                    control = None
+            if control is None:
+                control = self.__pages[index]()
+            self.__built[index] = control
+            self.__costs[index] = _subtree_cost(control)
+        self.__built.move_to_end(index)
+
+        # the current page and the one transitioning out are never evicted
+        while len(self.__built) - 1 > self.keep_alive or (
+            self.memory_budget is not None and sum(self.__costs.values()) > self.memory_budget
+        ):
+            evicted = next((i for i in self.__built if i != index and i != self.__previous), None)
+            if evicted is None:
+                break
+            del self.__built[evicted]
+            del self.__costs[evicted]
+
+    def __prefetch(self):
+        if self.__pages is None or not self.prefetch:
+            return
+        if callable(self.prefetch):
+            predicted = self.prefetch(self.__current)
+        else:
+            predicted = [
+                self.__current + d for k in range(1, self.prefetch + 1) for d in (k, -k)
+            ]
+        wanted = [
+            i for i in dict.fromkeys(predicted) if 0 <= i < len(self.__pages) and i not in self.__built
+        ]
+        self.__cancel_prefetch(keep=wanted)
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                self.prefetch_workers, thread_name_prefix="switcher-prefetch"
+            )
+        for i in wanted:
+            if i not in self.__prefetched:
+                self.__prefetched[i] = self.__executor.submit(self.__pages[i])
+
+    def __cancel_prefetch(self, keep: Sequence[int] = ()):
+        for i in [i for i in self.__prefetched if i not in keep]:
+            self.__prefetched.pop(i).cancel()
 
     def __contains__(self, item):
-        return item in self.__controls
+        # with `pages`, only the pages built so far are controls of the switcher
+        return item in self.__controls or item in self.__built.values()
     
     @property
     def orientation(self) -> Orientation:
@@ -122,5 +252,73 @@ class Switcher(ConstrainedControl):
     def controls(self, value: Optional[Sequence[Control]]):
         self.__controls = list(value) if value else []
     
+    # pages
+    @property
+    def pages(self) -> Optional[List[PageFactory]]:
+        return self.__pages
+
+    @pages.setter
+    def pages(self, value: Optional[Sequence[PageFactory]]):
+        self.__pages = list(value) if value is not None else None
+        self.__cancel_prefetch()
+        self.__built.clear()
+        self.__costs.clear()
+
+    @property
+    def mounted_pages(self) -> List[int]:
+        """Indices of the pages built from `pages` that are currently mounted, least recent first."""
+        return list(self.__built)
+
+    @property
+    def current_index(self) -> int:
+        return self.__current
+
     def switch(self, current_index: int):
-        self.invoke_method("switch", {"current": str(current_index)})
\ No newline at end of file
+        if current_index == self.__current:
+            return
+        self.__previous, self.__current = self.__current, current_index
+        if self.__pages is not None:
+            # mount the target page before the client animates to it
+            self.__mount(current_index)
+        # sends the changes held back while the target page was hidden
+        self.update()
+        self.invoke_method("switch", {"current": str(current_index)})
+        self.__prefetch()
+
+
+class _SwitcherPage(Control):
+    """
+    Holds one Switcher page. While the page is hidden the wrapper is isolated,
+    so updates of the Switcher do not descend into it.
+    """
+
+    def __init__(self, content: Control):
+        Control.__init__(self)
+        self.content = content
+        self.index = 0
+        self.active = False
+
+    def _get_control_name(self):
+        return "switcherpage"
+
+    def _get_children(self):
+        return [self.content]
+
+    def is_isolated(self) -> bool:
+        return not self.active
+
+    def before_update(self):
+        super().before_update()
+        self._set_attr_internal("n", str(self.index))
+        self._set_attr("visible", self.content.visible)
+
+
+def _subtree_cost(control: Control) -> int:
+    # rough estimate of the memory held by a page, used for memory_budget
+    cost = 0
+    stack = [control]
+    while stack:
+        c = stack.pop()
+        cost += sys.getsizeof(c) + sys.getsizeof(vars(c))
+        stack.extend(c._get_children())
+    return cost
\ No newline at end of file
@@ -0,0 +1,422 @@
+import base64
+import io
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.control import OptionalNumber
+from flet.core.ref import Ref
+from flet.core.types import ResponsiveNumber
+
+from xilowidgets.zoomer import Zoomer, ZoomerTransform
+
+# rows copied or downsampled at a time while building, as a multiple of tile_size
+_BAND_TILES = 4
+# Pillow modes stored as they are, and as 16 bits
+_DIRECT_MODES = ("L", "RGB", "RGBA")
+_16BIT_MODES = ("I;16", "I;16L", "I;16B", "I")
+
+
+class TilePyramid:
+    """
+    Multi-resolution tiles of a large image.
+
+    Level 0 is the full resolution and every further level halves the
+    previous one, down to a single tile. Each level is stored as a raw
+    memory-mapped file in `directory` and built in bands of rows, so neither
+    the source nor any level is ever held in memory as a whole. `source` may
+    be an image path or an array of shape (height, width[, channels]), e.g. a
+    `numpy.memmap`. Pillow memory-maps uncompressed files (raw TIFF, BMP, PPM)
+    itself; compressed formats are decoded by Pillow once.
+
+    Levels keep 8 or 16 bits per channel, as in the source; other array
+    dtypes are rejected and have to be rescaled by the caller. 16-bit
+    images are mapped to 8 bits only when a tile is encoded, linearly from
+    `display_range` (the full 16-bit range by default).
+
+    Tiles are encoded on demand and the most recently used `cache_tiles` of
+    them are kept. `encode(array)` may be replaced to use another imaging
+    library; it receives the tile as stored, uint8 or uint16. The default
+    needs Pillow.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, os.PathLike, Any],
+        directory: Union[None, str, os.PathLike] = None,
+        tile_size: int = 256,
+        tile_format: str = "JPEG",
+        quality: int = 85,
+        cache_tiles: int = 512,
+        encode: Optional[Callable[[Any], bytes]] = None,
+        display_range: Optional[Tuple[int, int]] = None,
+    ):
+        if np is None:
+            raise ImportError(
+                "TilePyramid requires numpy, install it with `pip install xilowidgets[image]`"
+            )
+        if PILImage is None and (encode is None or isinstance(source, (str, os.PathLike))):
+            raise ImportError(
+                "TilePyramid requires Pillow, install it with `pip install xilowidgets[image]`"
+            )
+        if not isinstance(source, (str, os.PathLike)):
+            _check_dtype(getattr(source, "dtype", None))
+        self.source = source
+        self.directory = os.fspath(directory) if directory is not None else tempfile.mkdtemp(prefix="tiles-")
+        self.tile_size = tile_size
+        self.tile_format = tile_format
+        self.quality = quality
+        self.cache_tiles = cache_tiles
+        self.encode = encode or self.__pil_encode
+        self.display_range = display_range or (0, 65535)
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__build_lock = threading.Lock()
+        self.__levels: List[Any] = []
+        self.__tiles: "OrderedDict[Tuple[int, int, int], bytes]" = OrderedDict()
+
+    @property
+    def built(self) -> bool:
+        return len(self.__levels) > 0
+
+    @property
+    def width(self) -> int:
+        return self.levels[0][0]
+
+    @property
+    def height(self) -> int:
+        return self.levels[0][1]
+
+    @property
+    def levels(self) -> List[Tuple[int, int]]:
+        """`(width, height)` of every level, the full resolution first."""
+        self.build()
+        return [(a.shape[1], a.shape[0]) for a in self.__levels]
+
+    def build(self):
+        """Builds all levels; called on first use."""
+        with self.__build_lock:
+            if self.__levels:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            band = self.tile_size * _BAND_TILES
+            with _open_source(self.source) as (shape, dtype, read_rows):
+                level = self.__memmap(0, shape, dtype)
+                for y in range(0, shape[0], band):
+                    level[y : y + band] = read_rows(y, min(y + band, shape[0]))
+                level.flush()
+                levels = [level]
+            while max(level.shape[0], level.shape[1]) > self.tile_size:
+                level = self.__downsample(len(levels), level, band)
+                levels.append(level)
+            self.__levels = levels
+
+    def __memmap(self, index: int, shape: Tuple[int, ...], dtype):
+        path = os.path.join(self.directory, f"level{index}.raw")
+        return np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+
+    def __downsample(self, index: int, previous, band: int):
+        h, w = previous.shape[:2]
+        nh, nw = (h + 1) // 2, (w + 1) // 2
+        level = self.__memmap(index, (nh, nw) + previous.shape[2:], previous.dtype)
+        for y in range(0, nh, band):
+            rows = previous[y * 2 : min((y + band) * 2, h)].astype(np.uint32)
+            # repeat the last row and column of odd sizes before averaging 2x2 blocks
+            if rows.shape[0] % 2:
+                rows = np.concatenate([rows, rows[-1:]], axis=0)
+            if w % 2:
+                rows = np.concatenate([rows, rows[:, -1:]], axis=1)
+            summed = rows[0::2, 0::2] + rows[1::2, 0::2] + rows[0::2, 1::2] + rows[1::2, 1::2]
+            level[y : y + summed.shape[0]] = ((summed + 2) // 4).astype(previous.dtype)
+        level.flush()
+        return level
+
+    def level_for(self, scale: float) -> int:
+        """Coarsest level that still has at least one image pixel per screen pixel at `scale`."""
+        self.build()
+        if scale <= 0:
+            return len(self.__levels) - 1
+        return min(max(int(math.floor(-math.log2(scale))), 0), len(self.__levels) - 1)
+
+    def tiles_in(
+        self, level: int, rect: Tuple[float, float, float, float]
+    ) -> List[Tuple[int, int, Tuple[float, float, float, float]]]:
+        """
+        Tiles of `level` intersecting `rect` (x, y, width, height in full-resolution
+        pixels) as `(col, row, tile_rect)`, with `tile_rect` in full-resolution pixels too.
+        """
+        lw, lh = self.levels[level]
+        fx, fy = self.width / lw, self.height / lh
+        ts = self.tile_size
+        x, y, w, h = rect
+        cols = range(max(int(x / fx // ts), 0), min(int(math.ceil((x + w) / fx / ts)), math.ceil(lw / ts)))
+        rows = range(max(int(y / fy // ts), 0), min(int(math.ceil((y + h) / fy / ts)), math.ceil(lh / ts)))
+        return [
+            (c, r, (c * ts * fx, r * ts * fy, min(ts, lw - c * ts) * fx, min(ts, lh - r * ts) * fy))
+            for r in rows
+            for c in cols
+        ]
+
+    def tile(self, level: int, col: int, row: int) -> bytes:
+        """Encoded tile at `col`, `row` of `level`."""
+        key = (level, col, row)
+        with self.__lock:
+            data = self.__tiles.get(key)
+            if data is not None:
+                self.__tiles.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+        self.build()
+        ts = self.tile_size
+        data = self.encode(np.ascontiguousarray(self.__levels[level][row * ts : (row + 1) * ts, col * ts : (col + 1) * ts]))
+        with self.__lock:
+            self.__tiles[key] = data
+            while len(self.__tiles) > self.cache_tiles:
+                self.__tiles.popitem(last=False)
+        return data
+
+    def __pil_encode(self, array) -> bytes:
+        if array.dtype == np.uint16:
+            lo, hi = self.display_range
+            scaled = (np.clip(array, lo, hi).astype(np.uint32) - lo) * 255 // max(hi - lo, 1)
+            array = scaled.astype(np.uint8)
+        buf = io.BytesIO()
+        img = PILImage.fromarray(array)
+        if self.tile_format.upper() in ("JPEG", "JPG") and img.mode not in ("L", "RGB"):
+            img = img.convert("RGB")
+        img.save(buf, format=self.tile_format, quality=self.quality)
+        return buf.getvalue()
+
+
+class TiledImage(ConstrainedControl):
+    """
+    Shows a `TilePyramid` as the content of a `Zoomer`.
+
+    The control is laid out at the full resolution of the image. Whenever the
+    Zoomer reports a new transform, the tiles of the matching level that
+    intersect the visible rect, widened by `margin` tiles, are shown; only
+    tiles the client does not hold yet are sent. The client keeps up to
+    `client_cache` decoded tiles and is told which ones to drop, in least
+    recently used order.
+
+    A pyramid that is not built yet is built on a worker thread once the
+    control is mounted, never inside `page.update()`; call `pyramid.build()`
+    beforehand to show the image right away.
+    """
+
+    def __init__(
+        self,
+        pyramid: TilePyramid,
+        zoomer: Optional[Zoomer] = None,
+        margin: int = 1,
+        client_cache: int = 256,
+        #
+        # ConstrainedControl
+        #
+        ref: Optional[Ref] = None,
+        key: Optional[str] = None,
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        col: Optional[ResponsiveNumber] = None,
+        opacity: OptionalNumber = None,
+        visible: Optional[bool] = None,
+        data: Any = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            ref=ref,
+            key=key,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+            col=col,
+            opacity=opacity,
+            visible=visible,
+            data=data,
+        )
+        self.pyramid = pyramid
+        self.margin = margin
+        self.client_cache = client_cache
+        self.__lock = threading.Lock()
+        self.__sent: "OrderedDict[str, None]" = OrderedDict()
+        self.__view: Optional[Tuple[int, Tuple[str, ...]]] = None
+        self.__zoomer: Optional[Zoomer] = None
+        self.zoomer = zoomer
+
+    def _get_control_name(self):
+        return "tiledimage"
+
+    def before_update(self):
+        super().before_update()
+        if self.pyramid.built:
+            self.width = self.pyramid.width
+            self.height = self.pyramid.height
+        self._set_attr("tileSize", self.pyramid.tile_size)
+
+    def did_mount(self):
+        super().did_mount()
+        if not self.pyramid.built:
+            threading.Thread(target=self.__build, daemon=True).start()
+
+    def __build(self):
+        self.pyramid.build()
+        if self.page is None:
+            return
+        self.update()
+        transform = self.__zoomer.transform if self.__zoomer is not None else None
+        if transform is not None:
+            self.show(transform)
+
+    def will_unmount(self):
+        super().will_unmount()
+        with self.__lock:
+            # a remounted client starts with an empty cache
+            self.__sent.clear()
+            self.__view = None
+
+    @property
+    def zoomer(self) -> Optional[Zoomer]:
+        return self.__zoomer
+
+    @zoomer.setter
+    def zoomer(self, value: Optional[Zoomer]):
+        if self.__zoomer is not None:
+            self.__zoomer._remove_transform_listener(self.show)
+        self.__zoomer = value
+        if value is not None:
+            value._add_transform_listener(self.show)
+
+    @property
+    def sent_tiles(self) -> int:
+        """Number of tiles the client currently holds."""
+        return len(self.__sent)
+
+    def show(self, transform: ZoomerTransform):
+        """Shows the tiles needed for `transform`; called by the Zoomer on every report."""
+        p = self.pyramid
+        if not p.built:
+            # shown by the build thread once it is done
+            return
+        level = p.level_for(transform.scale)
+        lw = p.levels[level][0]
+        pad = self.margin * p.tile_size * p.width / lw
+        rect = (transform.x - pad, transform.y - pad, transform.width + 2 * pad, transform.height + 2 * pad)
+        tiles = p.tiles_in(level, rect)
+        keys = tuple(f"{level}/{c}/{r}" for c, r, _ in tiles)
+
+        with self.__lock:
+            if self.__view == (level, keys) or self.page is None:
+                return
+            self.__view = (level, keys)
+            added: Dict[str, str] = {}
+            for key, (c, r, _) in zip(keys, tiles):
+                if key in self.__sent:
+                    self.__sent.move_to_end(key)
+                else:
+                    self.__sent[key] = None
+                    added[key] = base64.b64encode(p.tile(level, c, r)).decode()
+            evicted: List[str] = []
+            while len(self.__sent) > max(self.client_cache, len(keys)):
+                evicted.append(self.__sent.popitem(last=False)[0])
+
+        self.invoke_method(
+            "tiles",
+            {
+                "add": _dumps(added),
+                "evict": _dumps(evicted),
+                "view": _dumps([[k, *_round(rect)] for k, (_, _, rect) in zip(keys, tiles)]),
+            },
+        )
+
+
+class _ArraySource:
+    def __init__(self, array):
+        self.array = array
+
+    def __enter__(self):
+        return tuple(self.array.shape), self.array.dtype, lambda y0, y1: self.array[y0:y1]
+
+    def __exit__(self, *args):
+        pass
+
+
+class _PILSource:
+    def __init__(self, path: str):
+        self.path = path
+
+    def __enter__(self):
+        limit, PILImage.MAX_IMAGE_PIXELS = PILImage.MAX_IMAGE_PIXELS, None
+        try:
+            # gigapixel sources are expected, not a decompression bomb
+            self.img = PILImage.open(self.path)
+        finally:
+            PILImage.MAX_IMAGE_PIXELS = limit
+        mode = self.img.mode
+        if mode in _DIRECT_MODES:
+            target, dtype = None, np.uint8
+        elif mode in _16BIT_MODES:
+            target, dtype = None, np.uint16
+        elif mode == "F":
+            raise ValueError("TilePyramid does not support floating point images, rescale them first")
+        else:
+            # converted band by band, so the whole image is never converted at once
+            target, dtype = ("L" if mode == "1" else "RGBA" if "A" in mode or mode == "P" else "RGB"), np.uint8
+        w, h = self.img.size
+        channels = len(PILImage.getmodebands(target or mode))
+        shape = (h, w) if channels == 1 else (h, w, channels)
+
+        def read_rows(y0: int, y1: int):
+            band = self.img.crop((0, y0, w, y1))
+            if target is not None:
+                band = band.convert(target)
+            rows = np.asarray(band)
+            if dtype == np.uint16:
+                # "I" is 32-bit and "I;16B" big-endian, store both as native uint16
+                rows = np.clip(rows, 0, 65535).astype(np.uint16)
+            return rows.reshape((y1 - y0,) + shape[1:])
+
+        return shape, dtype, read_rows
+
+    def __exit__(self, *args):
+        self.img.close()
+
+
+def _check_dtype(dtype):
+    if dtype not in (np.uint8, np.uint16):
+        raise ValueError(
+            f"TilePyramid supports uint8 and uint16 arrays, got {dtype}; rescale the data first"
+        )
+
+
+def _open_source(source):
+    if isinstance(source, (str, os.PathLike)):
+        return _PILSource(os.fspath(source))
+    return _ArraySource(source)
+
+
+def _round(rect: Sequence[float]) -> List[float]:
+    return [round(v, 2) for v in rect]
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
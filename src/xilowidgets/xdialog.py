@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from typing import Any, List, Optional, Union
 from enum import Enum
 
@@ -6,6 +9,7 @@ from flet.core.alignment import Alignment
 from flet.core.animation import AnimationCurve
 from flet.core.buttons import OutlinedBorder
 from flet.core.control import Control, OptionalNumber
+from flet.core.control_event import ControlEvent
 from flet.core.ref import Ref
 from flet.core.text_style import TextStyle
 from flet.core.types import (
@@ -17,8 +21,15 @@ from flet.core.types import (
     PaddingValue,
 )
 
+from xilowidgets.attrcache import CachedJsonAttrs
 
-class XDialog(AdaptiveControl):
+# client default of XDialog.open_duration, in milliseconds
+_DEFAULT_DURATION = 300
+# extra time given to the close animation before a dismissed dialog is detached
+_CLOSE_MARGIN = 0.1
+
+
+class XDialog(CachedJsonAttrs, AdaptiveControl):
     """
     An alert dialog informs the user about situations that require acknowledgement. An alert dialog has an optional title and an optional list of actions. The title is displayed above the content and the actions are displayed below the content.
 
@@ -62,6 +73,17 @@ class XDialog(AdaptiveControl):
 
     ft.app(target=main)
     ```
+
+    With `auto_detach=True` the dialog removes itself from `page.overlay`
+    once its close animation (`open_duration`) has finished, so one-off
+    dialogs do not pile up in long sessions. Dialogs dismissed while the
+    server was busy are picked up by an `XDialogSweeper`.
+
+    `prepare(page)` mounts a closed dialog ahead of time, so its controls
+    are already in the client's store. Opening it afterwards with
+    `page.open()` only sends the `open` flag, and the launch animation
+    starts right away instead of after the whole subtree arrived. The
+    dialog widgets themselves are still built when the route opens.
     -----
 
     Online docs: https://flet.dev/docs/controls/XDialog
@@ -113,6 +135,7 @@ class XDialog(AdaptiveControl):
         semantics_label: Optional[str] = None,
         barrier_color: Optional[ColorValue] = None,
         on_dismiss: OptionalControlEventCallable = None,
+        auto_detach: Optional[bool] = None,
         #
         # AdaptiveControl
         #
@@ -132,6 +155,13 @@ class XDialog(AdaptiveControl):
 
         AdaptiveControl.__init__(self, adaptive=adaptive)
 
+        self.__on_dismiss: OptionalControlEventCallable = None
+        self.__closed_at: Optional[float] = None
+        self.__detach_timer: Optional[threading.Timer] = None
+        self._add_event_handler("dismiss", self.__handle_dismiss)
+        # set by an XDialogPool that keeps this dialog mounted for reuse
+        self._owner = None
+
         self.open = open
         self.bgcolor = bgcolor
         self.elevation = elevation
@@ -167,6 +197,7 @@ class XDialog(AdaptiveControl):
         self.offset_scale = offset_scale
         self.minimum_scale = minimum_scale
         self.maximum_scale = maximum_scale
+        self.auto_detach = auto_detach
 
     def _get_control_name(self):
         return "xdialog"
@@ -189,6 +220,67 @@ class XDialog(AdaptiveControl):
         if isinstance(self.__title_text_style, TextStyle):
             self._set_attr_json("titleTextStyle", self.__title_text_style)
 
+    def will_unmount(self):
+        super().will_unmount()
+        if self.__detach_timer is not None:
+            self.__detach_timer.cancel()
+            self.__detach_timer = None
+
+    def __handle_dismiss(self, e: ControlEvent):
+        self.__closed_at = time.monotonic()
+        if self.auto_detach and self._owner is None:
+            if self.__detach_timer is not None:
+                self.__detach_timer.cancel()
+            self.__detach_timer = threading.Timer(self._close_delay, self.detach)
+            self.__detach_timer.daemon = True
+            self.__detach_timer.start()
+        if asyncio.iscoroutinefunction(self.__on_dismiss):
+            e.page.run_task(self.__on_dismiss, e)
+        elif self.__on_dismiss is not None:
+            self.__on_dismiss(e)
+
+    @property
+    def _close_delay(self) -> float:
+        # the client reports the dismissal when the close animation starts
+        return self.open_duration / 1000 + _CLOSE_MARGIN
+
+    @property
+    def closed_for(self) -> Optional[float]:
+        """Seconds since the dialog was last dismissed, or `None` while open or never closed."""
+        if self.open or self.__closed_at is None:
+            return None
+        return time.monotonic() - self.__closed_at
+
+    def prepare(self, page):
+        """
+        Adds the dialog closed to `page.overlay`, sending its controls to the
+        client ahead of time, so a later `page.open()` is a single attribute
+        change.
+        """
+        self.prepared = True
+        self.open = False
+        if self not in page.overlay:
+            page.overlay.append(self)
+        page.update()
+
+    def detach(self) -> bool:
+        """
+        Removes the closed dialog from `page.overlay`, releasing its controls on
+        the client and the server. Returns False if it is open or not in the overlay.
+        """
+        self.__detach_timer = None
+        page = self.page
+        if page is None or self.open or self not in page.overlay:
+            return False
+        page.overlay.remove(self)
+        page.update()
+        self._detached()
+        return True
+
+    def _detached(self):
+        if self._owner is not None:
+            self._owner._forget(self)
+
     def _get_children(self):
         children = []
         if isinstance(self.__title, Control):
@@ -216,10 +308,10 @@ class XDialog(AdaptiveControl):
     
     @property
     def open_duration(self) -> OptionalNumber:
-        return self._get_attr("duration", data_type="int", def_value=250)
+        return self._get_attr("duration", data_type="int", def_value=_DEFAULT_DURATION)
 
     @open_duration.setter
-    def open_duration(self, value: OptionalNumber = 250):
+    def open_duration(self, value: OptionalNumber = _DEFAULT_DURATION):
         self._set_attr("duration", value)
     
     @property
@@ -510,11 +602,110 @@ class XDialog(AdaptiveControl):
         self.__clip_behavior = value
         self._set_enum_attr("clipBehavior", value, ClipBehavior)
 
+    # prepared
+    @property
+    def prepared(self) -> bool:
+        return self._get_attr("prepared", data_type="bool", def_value=False)
+
+    @prepared.setter
+    def prepared(self, value: Optional[bool]):
+        self._set_attr("prepared", value)
+
+    # auto_detach
+    @property
+    def auto_detach(self) -> bool:
+        return self.__auto_detach
+
+    @auto_detach.setter
+    def auto_detach(self, value: Optional[bool]):
+        self.__auto_detach = bool(value)
+
     # on_dismiss
     @property
     def on_dismiss(self) -> OptionalControlEventCallable:
-        return self._get_event_handler("dismiss")
+        return self.__on_dismiss
 
     @on_dismiss.setter
     def on_dismiss(self, handler: OptionalControlEventCallable):
-        self._add_event_handler("dismiss", handler)
\ No newline at end of file
+        self.__on_dismiss = handler
+
+
+class XDialogSweeper:
+    """
+    Periodically detaches closed XDialogs from the overlay of one page (session).
+
+    Every `interval` seconds, dialogs with `auto_detach` that were dismissed
+    more than their `open_duration` ago are removed in a single update;
+    this catches dialogs whose own detach did not run, e.g. because the page
+    was busy. With `include_all=True` dismissed dialogs without `auto_detach`
+    are reclaimed as well, which suits apps that `page.open()` a new XDialog
+    every time. Dialogs mounted with `prepare()` and never shown, and dialogs
+    kept by an `XDialogPool`, are left alone.
+    `stats()` reports the overlay size of the session.
+    """
+
+    def __init__(self, page, interval: float = 30.0, include_all: bool = False):
+        self.page = page
+        self.interval = interval
+        self.include_all = include_all
+        self.swept = 0
+        self.sweeps = 0
+        self.peak_overlay_size = len(page.overlay)
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.__thread is None:
+            self.__stop.clear()
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def stop(self):
+        self.__stop.set()
+        self.__thread = None
+
+    def sweep(self) -> int:
+        """Detaches the reclaimable dialogs now and returns how many there were."""
+        overlay = self.page.overlay
+        self.peak_overlay_size = max(self.peak_overlay_size, len(overlay))
+        dead = [c for c in list(overlay) if isinstance(c, XDialog) and self.__reclaimable(c)]
+        for dialog in dead:
+            overlay.remove(dialog)
+        if dead:
+            self.page.update()
+        for dialog in dead:
+            dialog._detached()
+        self.sweeps += 1
+        self.swept += len(dead)
+        return len(dead)
+
+    def stats(self) -> dict:
+        overlay = list(self.page.overlay)
+        dialogs = [c for c in overlay if isinstance(c, XDialog)]
+        self.peak_overlay_size = max(self.peak_overlay_size, len(overlay))
+        return {
+            "overlay_size": len(overlay),
+            "peak_overlay_size": self.peak_overlay_size,
+            "dialogs": len(dialogs),
+            "open_dialogs": sum(1 for d in dialogs if d.open),
+            "swept": self.swept,
+            "sweeps": self.sweeps,
+        }
+
+    def __reclaimable(self, dialog: XDialog) -> bool:
+        if dialog.open or dialog.prepared or not (dialog.auto_detach or self.include_all):
+            return False
+        if dialog._owner is not None:
+            # idle dialogs of an XDialogPool are closed on purpose
+            return False
+        closed_for = dialog.closed_for
+        # only dialogs that were shown and dismissed count as closed
+        return closed_for is not None and closed_for >= dialog._close_delay
+
+    def __run(self):
+        while not self.__stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception:
+                # the session is gone
+                return
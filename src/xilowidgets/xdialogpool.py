@@ -0,0 +1,179 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from flet.core.control import Control
+from flet.core.control_event import ControlEvent
+from flet.core.page import Page
+
+from xilowidgets.xdialog import XDialog
+
+
+class XDialogPool:
+    """
+    Reuses XDialogs built from the same template.
+
+    `template()` builds the full dialog once: shape, paddings, styles, a
+    `Text` title and content and the action buttons. `open()` takes a closed
+    dialog of that template from the pool (building one if none is idle),
+    patches only the title and content text and the action button texts, and
+    opens it. The structure is sent to the client once; reopening a pooled
+    dialog only sends the patched values and the `open` flag.
+
+    The client reports a dismissal (also after `close()`) when the close
+    animation starts, so a dialog goes back to the pool only once its
+    `open_duration` plus a small margin has passed. Up to `max_idle` closed
+    dialogs per template stay mounted in `page.overlay`, the rest are removed
+    from it.
+    """
+
+    def __init__(self, page: Page, max_idle: int = 2):
+        self.page = page
+        self.max_idle = max_idle
+        self.__lock = threading.Lock()
+        self.__idle: Dict[Callable[[], XDialog], List[XDialog]] = {}
+        self.__in_use: Dict[int, "_Pooled"] = {}
+        self.__pooled: Dict[int, "_Pooled"] = {}
+
+    def prewarm(self, template: Callable[[], XDialog], count: int = 1):
+        """Builds and mounts up to `count` closed dialogs of `template` ahead of time."""
+        added = []
+        with self.__lock:
+            idle = self.__idle.setdefault(template, [])
+            while len(idle) < min(count, self.max_idle):
+                dialog = self.__build(template)
+                idle.append(dialog)
+                added.append(dialog)
+        if added:
+            self.page.overlay.extend(added)
+            self.page.update()
+
+    def open(
+        self,
+        template: Callable[[], XDialog],
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        actions: Optional[Sequence[str]] = None,
+        on_action: Optional[Callable[[ControlEvent], Any]] = None,
+        data: Any = None,
+    ) -> XDialog:
+        """
+        Opens a dialog of `template` showing `title`, `content` and `actions` texts.
+        `on_action(e)` is called when one of the actions is clicked; `e.control`
+        is the button. Values left as `None` keep the template's texts.
+        """
+        with self.__lock:
+            idle = self.__idle.setdefault(template, [])
+            dialog = idle.pop() if idle else self.__build(template)
+            pooled = self.__pooled[id(dialog)]
+            self.__in_use[id(dialog)] = pooled
+
+        try:
+            if title is not None:
+                _set_text(dialog, "title", title)
+            if content is not None:
+                _set_text(dialog, "content", content)
+        except Exception:
+            with self.__lock:
+                self.__in_use.pop(id(dialog), None)
+                self.__idle.setdefault(template, []).append(dialog)
+            raise
+        pooled.on_action = on_action
+        dialog.data = data
+        if actions is not None:
+            for i, button in enumerate(pooled.buttons):
+                button.visible = i < len(actions)
+                if i < len(actions):
+                    button.text = actions[i]
+
+        if dialog in self.page.overlay:
+            dialog.open = True
+            dialog.update()
+        else:
+            self.page.open(dialog)
+        return dialog
+
+    def close(self, dialog: XDialog):
+        """Closes `dialog`; it returns to the pool once its close animation has finished."""
+        self.page.close(dialog)
+
+    @property
+    def idle(self) -> int:
+        with self.__lock:
+            return sum(len(d) for d in self.__idle.values())
+
+    @property
+    def in_use(self) -> int:
+        return len(self.__in_use)
+
+    def __build(self, template: Callable[[], XDialog]) -> XDialog:
+        dialog = template()
+        pooled = _Pooled(template, dialog.on_dismiss)
+        for button in dialog.actions:
+            if hasattr(button, "text"):
+                button.on_click = pooled.click
+                pooled.buttons.append(button)
+        dialog.on_dismiss = lambda e: self.__on_dismiss(e, pooled)
+        # keeps auto_detach and XDialogSweeper from unmounting it while pooled
+        dialog._owner = self
+        self.__pooled[id(dialog)] = pooled
+        return dialog
+
+    def __on_dismiss(self, e: ControlEvent, pooled: "_Pooled"):
+        # the dismissal is reported when the close animation starts
+        timer = threading.Timer(e.control._close_delay, self.__release, (e.control,))
+        timer.daemon = True
+        timer.start()
+        if pooled.on_dismiss is not None:
+            pooled.on_dismiss(e)
+
+    def __release(self, dialog: XDialog):
+        with self.__lock:
+            if dialog.open:
+                # reopened before the close animation finished
+                return
+            pooled = self.__in_use.pop(id(dialog), None)
+            if pooled is None:
+                # already back in the pool
+                return
+            pooled.on_action = None
+            idle = self.__idle.setdefault(pooled.template, [])
+            if len(idle) < self.max_idle:
+                idle.append(dialog)
+                return
+            self.__pooled.pop(id(dialog), None)
+            dialog._owner = None
+        if dialog in self.page.overlay:
+            self.page.overlay.remove(dialog)
+            self.page.update()
+
+    def _forget(self, dialog: XDialog):
+        # called when the dialog was detached from the overlay by other means
+        with self.__lock:
+            for idle in self.__idle.values():
+                if dialog in idle:
+                    idle.remove(dialog)
+            self.__in_use.pop(id(dialog), None)
+            self.__pooled.pop(id(dialog), None)
+        dialog._owner = None
+
+
+class _Pooled:
+    def __init__(self, template: Callable[[], XDialog], on_dismiss):
+        self.template = template
+        self.on_dismiss = on_dismiss
+        self.on_action: Optional[Callable[[ControlEvent], Any]] = None
+        self.buttons: List[Control] = []
+
+    def click(self, e: ControlEvent):
+        if self.on_action is not None:
+            self.on_action(e)
+
+
+def _set_text(dialog: XDialog, name: str, value: str):
+    current: Union[Control, str, None] = getattr(dialog, name)
+    if isinstance(current, Control) and hasattr(current, "value"):
+        current.value = value
+    elif name == "title":
+        dialog.title = value
+    else:
+        raise ValueError(f"XDialog template needs a Text {name} to set it by text")
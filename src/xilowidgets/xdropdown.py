@@ -29,6 +29,8 @@ from flet.core.types import (
     TextAlign,
 )
 
+from xilowidgets.attrcache import CachedJsonAttrs
+
 
 class Option(Control):
     def __init__(
@@ -155,7 +157,7 @@ class DropdownOption(Option):
     """Alias for Option"""
 
 
-class XDropdown(FormFieldControl):
+class XDropdown(CachedJsonAttrs, FormFieldControl):
     """
     A dropdown control that allows users to select a single option from a list of options.
     -----
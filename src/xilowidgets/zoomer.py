@@ -1,24 +1,76 @@
+import asyncio
+import json
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from flet.core.constrained_control import ConstrainedControl
 from flet.core.control import OptionalNumber, Control, Ref
+from flet.core.control_event import ControlEvent
 
-from flet.core.types import ResponsiveNumber, RotateValue, ScaleValue, OffsetValue, OptionalControlEventCallable
+from flet.core.types import ResponsiveNumber, RotateValue, ScaleValue, OffsetValue, OptionalControlEventCallable, OptionalEventCallable
 from flet.core.animation import AnimationValue
 from flet.core.tooltip import TooltipValue
 from flet.core.badge import BadgeValue
 
+
+@dataclass(frozen=True)
+class ZoomerTransform:
+    """Scale of the content and the part of it that is visible, in content coordinates."""
+
+    scale: float = 1.0
+    x: float = 0.0
+    y: float = 0.0
+    width: float = 0.0
+    height: float = 0.0
+
+    @property
+    def visible_rect(self) -> Tuple[float, float, float, float]:
+        return (self.x, self.y, self.width, self.height)
+
+
+@dataclass
+class ZoomerVariant:
+    """
+    Content shown while the scale is within `[min_scale, max_scale)`. `factory`
+    is called the first time the variant is needed and its control is kept.
+    """
+
+    factory: Callable[[], Control]
+    min_scale: float = 0.0
+    max_scale: float = float("inf")
+
+    def contains(self, scale: float, margin: float = 0.0) -> bool:
+        return self.min_scale * (1 - margin) <= scale < self.max_scale * (1 + margin)
+
+
 class Zoomer(ConstrainedControl):
     """
     Zoomer Control description.
+
+    With `on_transform_change` set, the client reports the scale and visible
+    rect at most once per `transform_throttle` milliseconds, always including
+    the final transform of a gesture. Reports arriving while the handler is
+    still busy are coalesced, so it only ever sees the latest one. The last
+    reported transform is cached in `transform`.
+
+    Instead of a fixed `content`, `variants` can provide one control per scale
+    range, e.g. a coarse diagram below 0.5 and the full one above 2.0. The
+    variant is switched on the server when a reported scale leaves the range
+    of the current one by more than `hysteresis` (relative to the range
+    bounds), so scales jittering around a bound do not swap back and forth.
+    Variants should lay out at the same size for the transform to carry over.
     """
 
     def __init__(
         self,
-        content: Optional[Control],
+        content: Optional[Control] = None,
         minimum_scale: OptionalNumber = None,
         maximum_scale: OptionalNumber = None,
+        on_transform_change: OptionalEventCallable["ZoomerTransformChangeEvent"] = None,
+        transform_throttle: OptionalNumber = 100,
+        variants: Optional[Sequence[ZoomerVariant]] = None,
+        hysteresis: float = 0.1,
         #
         # ConstrainedControl
         #
@@ -86,13 +138,119 @@ class Zoomer(ConstrainedControl):
             rtl=rtl,
         )
 
+        self.__transform: Optional[ZoomerTransform] = None
+        self.__on_transform_change: OptionalEventCallable["ZoomerTransformChangeEvent"] = None
+        self.__transform_listeners: List[Callable[[ZoomerTransform], Any]] = []
+        self.__delivering = False
+        self.__pending_transform: Optional["ZoomerTransformChangeEvent"] = None
+        self._add_event_handler("transform_change", self.__handle_transform_change)
+        self.__variants: List[ZoomerVariant] = []
+        self.__variant: Optional[int] = None
+        self.__built_variants: Dict[int, Control] = {}
+
         self.content = content
         self.minimum_scale = minimum_scale
         self.maximum_scale = maximum_scale
+        self.on_transform_change = on_transform_change
+        self.transform_throttle = transform_throttle
+        self.hysteresis = hysteresis
+        self.variants = variants
 
     def _get_control_name(self):
         return "zoomer"
-    
+
+    def before_update(self):
+        super().before_update()
+        if self.__variants and self.__variant is None:
+            self.__select_variant(self.__transform.scale if self.__transform is not None else 1.0)
+
+    async def __handle_transform_change(self, e: ControlEvent):
+        event = ZoomerTransformChangeEvent(e)
+        self.__transform = event.transform
+        if self.__delivering:
+            # latest wins, the running delivery picks it up when done
+            self.__pending_transform = event
+            return
+        self.__delivering = True
+        try:
+            while event is not None:
+                await self.__dispatch_transform(event)
+                event, self.__pending_transform = self.__pending_transform, None
+        finally:
+            self.__delivering = False
+
+    async def __dispatch_transform(self, event: "ZoomerTransformChangeEvent"):
+        for listener in list(self.__transform_listeners):
+            await self.__call(listener, event.transform)
+        if self.__on_transform_change is not None:
+            await self.__call(self.__on_transform_change, event)
+
+    @staticmethod
+    async def __call(callback: Callable, arg: Any):
+        if asyncio.iscoroutinefunction(callback):
+            await callback(arg)
+        else:
+            # waited for, so slow handlers get coalesced events too
+            await asyncio.to_thread(callback, arg)
+
+    def _add_transform_listener(self, listener: Callable[[ZoomerTransform], Any]):
+        self.__transform_listeners.append(listener)
+        self.__sync_transform_change()
+
+    def _remove_transform_listener(self, listener: Callable[[ZoomerTransform], Any]):
+        if listener in self.__transform_listeners:
+            self.__transform_listeners.remove(listener)
+        self.__sync_transform_change()
+
+    def __sync_transform_change(self):
+        wanted = self.__on_transform_change is not None or len(self.__transform_listeners) > 0
+        self._set_attr("onTransformChange", True if wanted else None)
+
+    # variants
+    @property
+    def variants(self) -> List[ZoomerVariant]:
+        return list(self.__variants)
+
+    @variants.setter
+    def variants(self, value: Optional[Sequence[ZoomerVariant]]):
+        if self.__variants:
+            self._remove_transform_listener(self.__on_variant_transform)
+        self.__variants = list(value or [])
+        self.__variant = None
+        self.__built_variants.clear()
+        if self.__variants:
+            self._add_transform_listener(self.__on_variant_transform)
+
+    @property
+    def variant(self) -> Optional[ZoomerVariant]:
+        """The variant currently shown."""
+        return self.__variants[self.__variant] if self.__variant is not None else None
+
+    def __on_variant_transform(self, transform: ZoomerTransform):
+        if self.__select_variant(transform.scale) and self.page is not None:
+            self.update()
+
+    def __select_variant(self, scale: float) -> bool:
+        current = self.variant
+        if current is not None and current.contains(scale, self.hysteresis):
+            return False
+        index = next((i for i, v in enumerate(self.__variants) if v.contains(scale)), None)
+        if index is None:
+            if current is not None:
+                # keep showing the last variant in gaps between ranges
+                return False
+            index = min(
+                range(len(self.__variants)),
+                key=lambda i: _scale_distance(self.__variants[i], scale),
+            )
+        if index == self.__variant:
+            return False
+        self.__variant = index
+        if index not in self.__built_variants:
+            self.__built_variants[index] = self.__variants[index].factory()
+        self.__content = self.__built_variants[index]
+        return True
+
     def _get_children(self):
         children = []
         if self.__content is not None:
@@ -124,3 +282,50 @@ class Zoomer(ConstrainedControl):
     @maximum_scale.setter
     def maximum_scale(self, value: OptionalNumber):
         self._set_attr("maximum_scale", value)
+
+    # transform
+    @property
+    def transform(self) -> Optional[ZoomerTransform]:
+        """Last reported transform, or `None` before the first report."""
+        return self.__transform
+
+    @property
+    def transform_throttle(self) -> OptionalNumber:
+        return self._get_attr("transformThrottle")
+
+    @transform_throttle.setter
+    def transform_throttle(self, value: OptionalNumber):
+        self._set_attr("transformThrottle", value)
+
+    @property
+    def on_transform_change(self) -> OptionalEventCallable["ZoomerTransformChangeEvent"]:
+        return self.__on_transform_change
+
+    @on_transform_change.setter
+    def on_transform_change(self, handler: OptionalEventCallable["ZoomerTransformChangeEvent"]):
+        self.__on_transform_change = handler
+        self.__sync_transform_change()
+
+
+def _scale_distance(variant: ZoomerVariant, scale: float) -> float:
+    # ratio to the nearest bound, so distances compare alike on both sides
+    if scale < variant.min_scale:
+        return variant.min_scale / max(scale, 1e-9)
+    if scale >= variant.max_scale:
+        return scale / variant.max_scale
+    return 1.0
+
+
+class ZoomerTransformChangeEvent(ControlEvent):
+    def __init__(self, e: ControlEvent):
+        super().__init__(e.target, e.name, e.data, e.control, e.page)
+        d = json.loads(e.data)
+        self.transform = ZoomerTransform(
+            scale=d.get("scale", 1.0),
+            x=d.get("x", 0.0),
+            y=d.get("y", 0.0),
+            width=d.get("width", 0.0),
+            height=d.get("height", 0.0),
+        )
+        self.scale: float = self.transform.scale
+        self.visible_rect: Tuple[float, float, float, float] = self.transform.visible_rect